@@ -2,19 +2,24 @@
 API endpoints and services
 """
 
-from .config import Config
+from .config import Config, get_config
 
 # Create a single Config instance for the entire application
-config = Config()
+config = get_config()
 # Note: Logging configuration is now handled by each entry point
 # - FastAPI: configured in main.py
 # - MCP Server: configured in skills/server.py
 
-from .modules import FetchWeather, GmailClient, CalendarClient, DriveClient, ContactManager, BrowserTools
+from .http import HttpClient, get_http_client
+
+# One outbound HTTP session shared by every service in the process
+http_client = get_http_client()
+
+from .modules import FetchWeather, ContactManager, BrowserTools
 from .services import WeatherService, EmailManager, CalendarService, DriveService
 
 # Create service instances with shared config (lazy initialization inside services)
-weather_service = WeatherService(config)
+weather_service = WeatherService(config, http_client)
 email_manager = EmailManager(config)  # Primary multi-account email service
 calendar_service = CalendarService(config)
 drive_service = DriveService(config)
@@ -22,9 +27,16 @@ ContactBooklet = ContactManager()
 
 
 __all__ = [
-    'config', 
+    'config', 'http_client',
     # Core modules (for advanced use)
-    'FetchWeather', 'GmailClient', 'CalendarClient', 'DriveClient', 'ContactManager', 'BrowserTools'
+    'FetchWeather', 'GmailClient', 'CalendarClient', 'DriveClient', 'ContactManager', 'BrowserTools',
     # High-level services (recommended for most use cases)
     'weather_service', 'email_manager', 'calendar_service', 'drive_service', 'ContactBooklet'
 ]
+
+
+def __getattr__(name):
+    # Google clients are resolved lazily by the modules package
+    if name in ('GmailClient', 'CalendarClient', 'DriveClient'):
+        return getattr(modules, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,14 +1,87 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import Field, field_validator
+from pydantic import BaseModel, Field, field_validator
+from dotenv import dotenv_values
 from pathlib import Path
-from typing import Union, Literal, Dict, List, Optional
+from typing import Any, Callable, Union, Literal, Dict, List, Mapping, Optional
+import atexit
+import json
 import logging
 import logging.config
+import queue
 import sys
 import os
+from logging.handlers import QueueHandler, QueueListener
+from functools import cached_property, lru_cache
 
-class EmailAccountConfig(BaseSettings):
-    """Configuration for a single email account."""
+# Resolved once at import instead of once per path default
+_APP_DIR = Path(__file__).resolve().parent
+
+# Non-string fields converted by hand when Config.reload skips validation
+_RELOAD_COERCE: Dict[str, Callable[[str], Any]] = {
+    "timeout": int,
+    "log_max_size": int,
+    "log_counts": int,
+    "log_path": lambda value: Path(value).absolute(),
+    "driver_path": Path,
+    "cors_origins": json.loads,
+}
+
+# Fields stored in .env as JSON text rather than a plain string
+_JSON_ENV_FIELDS = frozenset({"cors_origins"})
+
+# Background thread writing file log records; replaced on every logging reconfiguration
+_file_log_listener: Optional[QueueListener] = None
+
+# logging_config dict last passed to dictConfig, so repeated calls with it are skipped
+_applied_logging_config: Optional[Dict[str, Any]] = None
+
+
+def _stop_file_log_listener() -> None:
+    """Flush queued file records and stop the writer thread."""
+    global _file_log_listener
+    if _file_log_listener is not None:
+        _file_log_listener.stop()
+        _file_log_listener = None
+
+
+def _queue_file_handler() -> None:
+    """
+    Put the root 'file' handler behind a queue.
+
+    Logging calls then only enqueue the record; a QueueListener thread does
+    the RotatingFileHandler writes. The console handler stays synchronous.
+    """
+    global _file_log_listener
+    root = logging.getLogger()
+    file_handler = next((h for h in root.handlers if h.get_name() == 'file'), None)
+    if file_handler is None:
+        return
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setLevel(file_handler.level)
+    root.removeHandler(file_handler)
+    root.addHandler(queue_handler)
+    _file_log_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _file_log_listener.start()
+
+
+atexit.register(_stop_file_log_listener)
+
+
+# EmailAccountConfig fields stored in email_accounts.json
+_ACCOUNT_FILE_FIELDS = frozenset({
+    "name", "provider", "display_name", "google_credentials_path", "google_token_path",
+    "enabled", "default_account",
+})
+
+
+class EmailAccountConfig(BaseModel):
+    """
+    Configuration for a single email account.
+
+    A plain model rather than BaseSettings: values come from email_accounts.json,
+    so construction should not scan the environment and .env for every account.
+    """
     name: str = Field(..., description="Account name (e.g., 'personal', 'work')")
     provider: str = Field("gmail", description="Email provider (gmail, outlook, etc.)")
     display_name: str = Field("", description="Display name for the account")
@@ -34,6 +107,12 @@ class EmailAccountConfig(BaseSettings):
     enabled: bool = Field(True, description="Whether this account is enabled")
     default_account: bool = Field(False, description="Whether this is the default account")
 
+    def to_dict(self) -> Dict[str, Union[str, bool, None]]:
+        """Serializable form stored in email_accounts.json."""
+        # pydantic-core builds the dict (Paths as strings) in field order; warnings are
+        # off because update_account may assign a plain str to a Path field
+        return self.model_dump(mode="json", include=_ACCOUNT_FILE_FIELDS, warnings=False)
+
 class Config(BaseSettings):
     """
     Application configuration class using Pydantic BaseSettings.
@@ -61,6 +140,11 @@ class Config(BaseSettings):
     """
     # Security
     security_key: Union[None, str] = Field(None, env="SECURITY_KEY")
+    # Frontend origins allowed to call the API with credentials (JSON list in .env)
+    cors_origins: List[str] = Field(
+        default_factory=lambda: ["http://localhost:5173", "http://127.0.0.1:5173"],
+        env="CORS_ORIGINS"
+    )
 
     # Weather
     weather_api_key: Union[None, str] = Field(None, env="WEATHER_API_KEY")
@@ -85,29 +169,100 @@ class Config(BaseSettings):
 
     # logging configuration
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field("INFO", env="LOG_LEVEL")
-    log_path: Path = Field(Path(__file__).parent / "logs" / "app.log", env="LOG_PATH")
+    log_path: Path = Field(_APP_DIR / "logs" / "app.log", env="LOG_PATH")
     log_max_size: int = Field(10, description="max log file size in MB", env="LOG_MAX_SIZE")
     log_counts: int = Field(10, description="number of logs will be kept", env="LOG_COUNTS")
     log_format: str = Field(
-        "%(acstime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s",
+        "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s",
         env="LOG_FORMAT"
     )
     # for web accessing
     user_agent: Union[None, str] = Field(None, env="USER-AGENT")
-    driver_path: Path = Field(Path(__file__).resolve().parent.parent / 'drivers' / 'chromedriver.exe', env="DRIVER_PATH")
+    driver_path: Path = Field(_APP_DIR.parent / 'drivers' / 'chromedriver.exe', env="DRIVER_PATH")
 
-    BASE_DIR: Path = Path(__file__).resolve().parent
+    BASE_DIR: Path = _APP_DIR
     db_path: str = f"sqlite:///{(BASE_DIR / 'db/app.db').resolve()}"
  
     model_config = SettingsConfigDict(
-        env_file=Path(__file__).resolve().parent / ".env",
-        env_file_encoding='utf-8'
+        env_file=_APP_DIR / ".env",
+        env_file_encoding='utf-8',
+        defer_build=True
     )
 
     def __init__(self, **kwargs):
         """Initialize config. Email accounts are now managed by EmailAccountManager."""
         super().__init__(**kwargs)
 
+    def validate_env_value(self, key: str, value: str) -> Any:
+        """
+        Validate a single .env value against the field it sets, before it is written.
+
+        Runs the field's type check and field validators (e.g. validate_log_path)
+        on a copy of this config, so the live settings are untouched. Keys that
+        are not Config fields are returned unchanged.
+
+        Args:
+            key: .env key, matched case-insensitively to a field name
+            value: Raw string value as it would be written to .env
+
+        Returns:
+            The validated field value
+
+        Raises:
+            ValueError: If the value is not valid for the field (pydantic.ValidationError
+                        and json.JSONDecodeError are both subclasses)
+        """
+        name = key.lower()
+        if name not in type(self).model_fields:
+            return value
+        parsed = json.loads(value) if name in _JSON_ENV_FIELDS else value
+        probe = self.model_copy()
+        type(self).__pydantic_validator__.validate_assignment(probe, name, parsed)
+        return getattr(probe, name)
+
+    def reload(self) -> "Config":
+        """
+        Refresh this config in place from the .env file without re-running validation.
+
+        Values were validated at startup, and values written through the API
+        are checked with validate_env_value before they reach .env, so the
+        reload path after update_keys builds the new state with model_construct
+        and only converts the few non-string fields. Environment variables still
+        take precedence over the .env file, as they do at startup.
+        """
+        return self.reload_from(dotenv_values(
+            self.model_config["env_file"], encoding=self.model_config["env_file_encoding"]
+        ))
+
+    def reload_from(self, env: Mapping[str, Optional[str]]) -> "Config":
+        """
+        Refresh this config in place from already parsed .env values.
+
+        Lets a caller that has just written the .env file hand over its parse
+        instead of having reload() read the file again.
+
+        Args:
+            env: Mapping of .env keys to values, as returned by dotenv_values
+        """
+        sources = {key.lower(): value for key, value in env.items()}
+        sources.update((key.lower(), value) for key, value in os.environ.items())
+
+        fields = type(self).model_fields
+        values = {}
+        for name in fields:
+            raw = sources.get(name)
+            if raw is None:
+                continue
+            coerce = _RELOAD_COERCE.get(name)
+            values[name] = coerce(raw) if coerce else raw
+
+        fresh = type(self).model_construct(**values)
+        for name in fields:
+            setattr(self, name, getattr(fresh, name))
+        # Derived from the fields above, so rebuild it on next access
+        self.__dict__.pop('logging_config', None)
+        return self
+
     @field_validator('log_path')
     def validate_log_path(cls, value: Path) -> Path:
         """Ensure log directory exists and return absolute path"""
@@ -115,27 +270,24 @@ class Config(BaseSettings):
         value.parent.mkdir(parents=True, exist_ok=True)
         return value
 
-    @property
+    @cached_property
     def logging_config(self) -> dict:
-        """Generate logging configuration dictionary with dynamic formatter detail based on log level."""
-        # More detailed format for DEBUG/ERROR/CRITICAL
-        detailed_format = (
-            "%(asctime)s [%(levelname)s] %(name)s (%(filename)s:%(lineno)d): %(message)s"
-        )
-        # Simpler format for INFO/WARNING
-        simple_format = "%(asctime)s [%(levelname)s] %(message)s"
-        # Use detailed format for DEBUG, ERROR, CRITICAL
+        """Logging configuration dictionary with dynamic formatter detail based on log level, built once."""
+        # Use the configured detailed format for DEBUG, ERROR, CRITICAL
         if self.log_level in ("DEBUG", "ERROR", "CRITICAL"):
-            fmt = detailed_format
+            fmt = self.log_format
         else:
-            fmt = simple_format
+            # Simpler format for INFO/WARNING
+            fmt = "%(asctime)s [%(levelname)s] %(message)s"
         return {
             'version': 1,
             'disable_existing_loggers': False,
             'formatters': {
                 'standard': {
                     'format': fmt,
-                    'datefmt': '%Y-%m-%d %H:%M:%S'
+                    'datefmt': '%Y-%m-%d %H:%M:%S',
+                    'style': '%',
+                    'validate': False
                 },
             },
             'handlers': {
@@ -147,7 +299,8 @@ class Config(BaseSettings):
                 },
                 'file': {
                     'class': 'logging.handlers.RotatingFileHandler',
-                    'level': self.log_level,                    'formatter': 'standard',
+                    'level': self.log_level,
+                    'formatter': 'standard',
                     'filename': str(self.log_path),
                     'maxBytes': self.log_max_size * 1024 * 1024,  # Convert MB to bytes
                     'backupCount': self.log_counts,
@@ -163,18 +316,38 @@ class Config(BaseSettings):
             }
         }
     
-    def configure_logging(self) -> None:
-        """Configure the logging system using the settings defined in the class."""
-        logging.config.dictConfig(self.logging_config)
+    def configure_logging(self, force: bool = False) -> None:
+        """
+        Configure the logging system using the settings defined in the class.
+
+        dictConfig tears down and rebuilds every handler, so the call is skipped
+        when the current logging_config is the one already applied. reload()
+        rebuilds logging_config, which makes the next call apply it again.
+
+        Args:
+            force: Reconfigure even if this logging_config was already applied
+        """
+        global _applied_logging_config
+        logging_config = self.logging_config
+        if not force and logging_config is _applied_logging_config:
+            return
+        # Stop the old writer before dictConfig closes the handler it writes to
+        _stop_file_log_listener()
+        logging.config.dictConfig(logging_config)
+        _queue_file_handler()
+        _applied_logging_config = logging_config
     
     def configure_fastapi_logging(self) -> None:
         """Configure verbose logging for FastAPI application"""
-        logging.config.dictConfig(self.logging_config)
+        self.configure_logging()
         logging.captureWarnings(True)
         
     def configure_mcp_logging(self) -> None:
         """Configure minimal logging for MCP server to prevent JSON-RPC parsing issues"""
         # This must be done BEFORE importing any modules that might log
+        global _applied_logging_config
+        # The handlers below replace whatever configure_logging installed
+        _applied_logging_config = None
         # Set up a file handler instead of using basicConfig (which sets up console logging)
         mcp_log_file = self.log_path.parent / "mcp.log"
         file_handler = logging.FileHandler(mcp_log_file)
@@ -340,3 +513,9 @@ class Config(BaseSettings):
         manager = EmailAccountManager(self)
         account_names = manager.list_account_names(enabled_only)
         return [manager.get_account_config(name) for name in account_names if manager.get_account_config(name)]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Return the process-wide Config, parsing the environment and .env only once."""
+    return Config()
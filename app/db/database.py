@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, declarative_base
 from .. import config
 import os
@@ -11,5 +11,18 @@ if config.db_path.startswith("sqlite:///"):
     os.makedirs(db_dir, exist_ok=True)
 
 engine = create_engine(config.db_path, echo=True, future=True)
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Tune each new pooled SQLite connection once, when it is opened."""
+        cursor = dbapi_connection.cursor()
+        # WAL lets readers proceed during a write; NORMAL sync is durable across app crashes in WAL mode
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
+
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
 Base = declarative_base()
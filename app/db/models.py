@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text
+from sqlalchemy import Column, Index, Integer, String, Text
 from .database import Base
 
 class Contact(Base):
@@ -6,6 +6,10 @@ class Contact(Base):
     id = Column(Integer, primary_key=True, index=True)
     surname = Column(String, nullable=False)
     forename = Column(String, nullable=False)
+    # Casefolded copies of the names, kept in sync by ContactManager for name searches
+    # surname_lc lookups use the leading column of ix_contacts_name_lc below
+    surname_lc = Column(String, nullable=True)
+    forename_lc = Column(String, nullable=True, index=True)
     other_names = Column(Text, nullable=True)  # JSON-encoded list
     email = Column(String, nullable=True)
     phone = Column(String, nullable=False)
@@ -13,3 +17,8 @@ class Contact(Base):
     tags = Column(Text, nullable=True)         # JSON-encoded list
     others = Column(Text, nullable=True)       # JSON-encoded dict
 
+    __table_args__ = (
+        # Covers the id lookup of name searches, so matching never reads full rows
+        Index("ix_contacts_name_lc", "surname_lc", "forename_lc"),
+    )
+
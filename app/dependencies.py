@@ -1,11 +1,20 @@
 from typing import Optional
+import hmac
 from fastapi import HTTPException, Header
 from . import config
 
 API_TOKEN = config.security_key or "you-will-never-guess"
+# Expected Authorization header, encoded once for constant-time comparison
+_EXPECTED_AUTHORIZATION = f"Bearer {API_TOKEN}".encode()
+
+def refresh_token() -> None:
+    """Recompute the expected token after the config has been reloaded."""
+    global API_TOKEN, _EXPECTED_AUTHORIZATION
+    API_TOKEN = config.security_key or "you-will-never-guess"
+    _EXPECTED_AUTHORIZATION = f"Bearer {API_TOKEN}".encode()
 
 def verify_token(authorization: Optional[str] = Header(None)):
-    if authorization != f"Bearer {API_TOKEN}":
+    if authorization is None or not hmac.compare_digest(authorization.encode(), _EXPECTED_AUTHORIZATION):
         raise HTTPException(status_code=401, detail="Unauthorized")
 
 def get_current_token() -> str:
@@ -0,0 +1,57 @@
+"""
+Shared outbound HTTP client
+
+One aiohttp session per process so every service that talks to the network
+(weather, location lookup, future API clients) shares a single connection
+pool, DNS cache and TLS session cache.
+"""
+
+from functools import lru_cache
+from typing import Optional
+import aiohttp
+
+from .config import get_config
+
+
+class HttpClient:
+    """
+    Process-wide holder for the shared aiohttp.ClientSession.
+
+    The session is created lazily inside the running event loop and can be
+    re-created after aclose(), so the same instance survives app restarts in tests.
+    """
+
+    __slots__ = ("config", "_session")
+
+    def __init__(self, config):
+        self.config = config
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=20,
+                ttl_dns_cache=600,
+                use_dns_cache=True,
+                enable_cleanup_closed=True
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.config.timeout, connect=3)
+            )
+        return self._session
+
+    async def aclose(self) -> None:
+        """Close the shared session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+@lru_cache(maxsize=1)
+def get_http_client() -> HttpClient:
+    """Return the process-wide HttpClient built from the shared config."""
+    return HttpClient(get_config())
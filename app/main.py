@@ -1,25 +1,33 @@
 """
 This should use FastAPI to expose key functions to the frontend
 """
+from contextlib import asynccontextmanager
 from typing import Optional
 from fastapi import FastAPI, HTTPException, Depends
 from pydantic import BaseModel, StringConstraints
-from .utils import update_keys
-from . import config
+from .utils import update_keys_async, read_env_values
+from . import config, http_client
 
 # Configure logging for FastAPI application
 config.configure_fastapi_logging()
 
-from .dependencies import verify_token
+from .dependencies import verify_token, refresh_token
 from .routes import weather_endpoints
+from .modules.weather import reset_fetcher
 from fastapi.responses import HTMLResponse
 from fastapi.middleware.cors import CORSMiddleware
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release the pooled connections shared by all outbound services
+    await http_client.aclose()
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Change to your frontend URL(s) in production
+    allow_origins=config.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -32,19 +40,34 @@ class APIKeyRequest(BaseModel):
     value: str = StringConstraints(min_length=1)
 
 
-@app.get('/')
-async def root():
-    return HTMLResponse(content=
+# The landing page never changes, so one response (body encoded, headers built) serves every request
+_ROOT_RESPONSE = HTMLResponse(content=
     """
     <h1>Backend for Friday.</h1>
     """)
 
+@app.get('/')
+async def root():
+    return _ROOT_RESPONSE
+
 @app.post('/set_api_key')
 async def set_key(
         request: APIKeyRequest,
         _: None = Depends(verify_token)
     ):
-    update_keys(request.key, request.value)
+    try:
+        # Reject bad input before .env is touched, so the file never holds a value the config cannot load
+        config.validate_env_value(request.key, request.value)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid value for '{request.key}': {e}")
+    if not await update_keys_async(request.key, request.value):
+        # Nothing was written, so the loaded config is already current
+        return {"message": f"Key '{request.key}' unchanged"}
+    # Reuse the contents just written rather than reading .env again
+    config.reload_from(read_env_values())
+    # Objects that copied config values at construction would otherwise keep the old ones
+    refresh_token()
+    reset_fetcher()
     return {"message": f"Key '{request.key}' updated successfully"}
 
 
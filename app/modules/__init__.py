@@ -2,11 +2,25 @@
 Modules for APIs
 """
 
-from .weather import FetchWeather, Location
-from .google_clients import (
-    GmailClient,
-    CalendarClient,
-    DriveClient
-)
+import importlib
+
+from .weather import FetchWeather, Location, WeatherMode
 from .contact_booklet import ContactManager
-from .Browser_Tools import BrowserTools
\ No newline at end of file
+from .Browser_Tools import BrowserTools
+
+# Google clients pull in googleapiclient and google-auth, so they are only
+# imported when first accessed (PEP 562)
+_LAZY_CLIENTS = {
+    'GmailClient': '.google_clients.gmail_client',
+    'CalendarClient': '.google_clients.calendar_client',
+    'DriveClient': '.google_clients.drive_client',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_CLIENTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,16 @@
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from sqlalchemy import and_, inspect, or_, text
 from sqlalchemy.orm import Session
 from app.db.database import SessionLocal, Base, engine
 from app.db.models import Contact as ORMContact
 import json
 
-@dataclass
+# Fields exposed by Contact.to_dict, in output order
+_FIELDS = ('id', 'surname', 'forename', 'other_names', 'email', 'phone', 'address', 'tags', 'others')
+
+@dataclass(slots=True)
 class Contact:
     surname: str
     forename: str
@@ -17,15 +22,156 @@ class Contact:
     phone: Optional[str] = None
     id: Optional[int] = None  # Database ID, populated when loaded from DB
 
+    # Validation settings used by parse_contact; unknown keys are rejected like Contact(**data) did
+    __pydantic_config__ = ConfigDict(extra='forbid', coerce_numbers_to_str=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the contact as a plain dict for tool responses."""
+        return {k: getattr(self, k) for k in _FIELDS}
+
+# ORM columns selected for dict lookups, in _FIELDS order, and the JSON-encoded ones with their empty values
+_FIELD_COLUMNS = tuple(getattr(ORMContact, k) for k in _FIELDS)
+_JSON_FIELDS = (('other_names', list), ('tags', list), ('others', dict))
+
+# Validator built once from the Contact fields; runs in pydantic-core on each call
+_contact_adapter = TypeAdapter(Contact)
+
+def parse_contact(data: Dict[str, Any]) -> Contact:
+    """Validate a contact payload from a tool call, raising pydantic.ValidationError on bad input."""
+    return _contact_adapter.validate_python(data)
+
+def parse_contacts(items: List[Dict[str, Any]], require_id: bool = False) -> Tuple[List[Contact], List[Dict[str, Any]]]:
+    """
+    Validate a batch of contact payloads.
+    
+    Args:
+        items: Contact payloads from a tool call
+        require_id: Reject payloads without an 'id', or repeating an earlier entry's 'id',
+            as needed for updates
+    
+    Returns:
+        The valid contacts in input order, and {'index', 'error'} entries for the invalid ones
+    """
+    contacts, failed = [], []
+    first_index: Dict[int, int] = {}
+    for index, item in enumerate(items):
+        try:
+            contact = _contact_adapter.validate_python(item)
+        except ValidationError as e:
+            failed.append({'index': index, 'error': str(e)})
+            continue
+        if require_id:
+            if contact.id is None:
+                failed.append({'index': index, 'error': "Missing 'id'"})
+                continue
+            if contact.id in first_index:
+                failed.append({'index': index, 'error': f"Duplicate id {contact.id}, first given at index {first_index[contact.id]}"})
+                continue
+            first_index[contact.id] = index
+        contacts.append(contact)
+    return contacts, failed
+
+def _column_values(contact: Contact) -> Dict[str, Any]:
+    """Column values for storing a contact, including the casefolded name columns."""
+    return {
+        'surname': contact.surname,
+        'forename': contact.forename,
+        'surname_lc': contact.surname.casefold(),
+        'forename_lc': contact.forename.casefold(),
+        'other_names': json.dumps(contact.other_names),
+        'email': contact.email,
+        'phone': contact.phone,
+        'address': contact.address,
+        'tags': json.dumps(contact.tags),
+        'others': json.dumps(contact.others)
+    }
+
+def _name_filter(name: str):
+    """Case-insensitive partial match on surname or forename against the casefolded columns."""
+    pattern = f"%{name.casefold()}%"
+    return ORMContact.surname_lc.like(pattern) | ORMContact.forename_lc.like(pattern)
+
+# Ordering and paging key for the id pass of name searches. Plain id lets SQLite
+# walk the rowid table (full rows, JSON columns included) to satisfy ORDER BY;
+# id + 0 cannot use the rowid, so the planner scans the covering ix_contacts_name_lc instead
+_SCAN_ID = ORMContact.id + 0
+
+# Upper bound for prefix ranges: every string starting with p sorts below p + _MAX_CHAR
+_MAX_CHAR = chr(0x10FFFF)
+
+def _name_exact_filter(name: str):
+    """Case-insensitive exact match on surname or forename, seeking the casefolded column indexes."""
+    folded = name.casefold()
+    return or_(ORMContact.surname_lc == folded, ORMContact.forename_lc == folded)
+
+def _name_prefix_filter(name: str):
+    """
+    Case-insensitive prefix match on surname or forename, written as ranges so
+    SQLite can seek the casefolded column indexes instead of scanning the table.
+    """
+    low = name.casefold()
+    high = low + _MAX_CHAR
+    return or_(
+        and_(ORMContact.surname_lc >= low, ORMContact.surname_lc < high),
+        and_(ORMContact.forename_lc >= low, ORMContact.forename_lc < high)
+    )
+
+def _migrate_name_columns():
+    """
+    Add and backfill surname_lc/forename_lc on databases created before they existed.
+    create_all only creates missing tables, so the columns and their indexes are added here,
+    and the single-column surname_lc index of earlier schemas is dropped.
+    """
+    table = ORMContact.__table__
+    columns = {c['name'] for c in inspect(engine).get_columns(table.name)}
+    with engine.begin() as conn:
+        for column in ('surname_lc', 'forename_lc'):
+            if column not in columns:
+                conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {column} VARCHAR"))
+        for index in table.indexes:
+            index.create(bind=conn, checkfirst=True)
+        # Redundant with ix_contacts_name_lc, whose leading column is surname_lc
+        conn.execute(text("DROP INDEX IF EXISTS ix_contacts_surname_lc"))
+        # Casefold in Python so rows match exactly what add_contact/update_contact store
+        rows = conn.execute(text(
+            f"SELECT id, surname, forename FROM {table.name} "
+            "WHERE surname_lc IS NULL OR forename_lc IS NULL"
+        )).all()
+        if rows:
+            conn.execute(
+                text(f"UPDATE {table.name} SET surname_lc = :s, forename_lc = :f WHERE id = :id"),
+                [{'id': r.id, 's': r.surname.casefold(), 'f': r.forename.casefold()} for r in rows]
+            )
+
 class ContactManager:
     def __init__(self):
         # Ensure all tables are created before using the session
         Base.metadata.create_all(bind=engine)
+        _migrate_name_columns()
         self.db: Session = SessionLocal()
 
-    def load_contacts(self, offset: int = 0, limit: int = 20):
+    def load_contacts(self, offset: int = 0, limit: int = 20, cursor: Optional[int] = None):
+        """
+        Load a page of contacts in ID order.
+        
+        Args:
+            offset: Number of records to skip; ignored when cursor is given
+            limit: Maximum number of records to return
+            cursor: ID of the last contact on the previous page
+            
+        Returns:
+            Dict with 'success', 'contacts' and 'next_cursor' (None on the last page)
+        """
+        if limit < 1:
+            return {'success': False, 'error': 'limit must be at least 1', 'manager': 'ContactBookletService'}
         try:
-            contacts = self.db.query(ORMContact).offset(offset).limit(limit).all()
+            query = self.db.query(ORMContact).order_by(ORMContact.id)
+            if cursor is not None:
+                # Seek past the previous page through the primary key instead of scanning skipped rows
+                query = query.filter(ORMContact.id > cursor)
+            elif offset:
+                query = query.offset(offset)
+            contacts = query.limit(limit).all()
             result = []
             for c in contacts:
                 result.append(Contact(
@@ -39,22 +185,14 @@ class ContactManager:
                     others=json.loads(c.others) if c.others else {},
                     id=c.id
                 ))
-            return {'success': True, 'contacts': result}
+            next_cursor = result[-1].id if result and len(result) == limit else None
+            return {'success': True, 'contacts': result, 'next_cursor': next_cursor}
         except Exception as e:
             return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
 
     def add_contact(self, contact: Contact):
         try:
-            db_contact = ORMContact(
-                surname=contact.surname,
-                forename=contact.forename,
-                other_names=json.dumps(contact.other_names),
-                email=contact.email,
-                phone=contact.phone,
-                address=contact.address,
-                tags=json.dumps(contact.tags),
-                others=json.dumps(contact.others)
-            )
+            db_contact = ORMContact(**_column_values(contact))
             self.db.add(db_contact)
             self.db.commit()
             self.db.refresh(db_contact)
@@ -63,19 +201,46 @@ class ContactManager:
             self.db.rollback()
             return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
 
-    def find_contact(self, name: str = None, contact_id: int = None, offset: int = 0, limit: int = 20):
+    def add_contacts(self, contacts: List[Contact]):
+        """
+        Add several contacts in a single transaction.
+        
+        Args:
+            contacts: Contacts to insert
+            
+        Returns:
+            Dict with 'success' and 'contact_ids' in input order, or 'error' message
+        """
+        try:
+            db_contacts = [ORMContact(**_column_values(c)) for c in contacts]
+            self.db.add_all(db_contacts)
+            # Flush assigns the ids; read them before commit expires the instances
+            self.db.flush()
+            contact_ids = [c.id for c in db_contacts]
+            self.db.commit()
+            return {'success': True, 'contact_ids': contact_ids}
+        except Exception as e:
+            self.db.rollback()
+            return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
+
+    def find_contact(self, name: str = None, contact_id: int = None, offset: int = 0, limit: int = 20,
+                     cursor: Optional[int] = None):
         """
         Find contacts by name or ID.
         
         Args:
             name: Name to search for (searches both surname and forename)
             contact_id: Specific contact ID to find
-            offset: Number of records to skip (for pagination)
+            offset: Number of records to skip (for pagination); ignored when cursor is given
             limit: Maximum number of records to return
+            cursor: ID of the last contact on the previous page of a name search
             
         Returns:
-            Dict with 'success' boolean and either 'contacts' list or 'error' message
+            Dict with 'success' boolean and either 'contacts' list and 'next_cursor'
+            (None on the last page) or 'error' message
         """
+        if limit < 1:
+            return {'success': False, 'error': 'limit must be at least 1', 'manager': 'ContactBookletService'}
         try:
             if contact_id is not None:
                 # Search by specific ID
@@ -92,16 +257,20 @@ class ContactManager:
                         others=json.loads(contact.others) if contact.others else {},
                         id=contact.id
                     )]
-                    return {'success': True, 'contacts': result}
+                    return {'success': True, 'contacts': result, 'next_cursor': None}
                 else:
-                    return {'success': True, 'contacts': []}
+                    return {'success': True, 'contacts': [], 'next_cursor': None}
             elif name is not None:
-                # Search by name
-                query = self.db.query(ORMContact).filter(
-                    (ORMContact.surname.ilike(f"%{name}%")) |
-                    (ORMContact.forename.ilike(f"%{name}%"))
-                )
-                contacts = query.offset(offset).limit(limit).all()
+                # Search by name: match and paginate on ids alone, then load only the selected rows
+                query = self.db.query(ORMContact.id).filter(_name_filter(name)).order_by(_SCAN_ID)
+                if cursor is not None:
+                    query = query.filter(_SCAN_ID > cursor)
+                elif offset:
+                    query = query.offset(offset)
+                ids = [row.id for row in query.limit(limit)]
+                if not ids:
+                    return {'success': True, 'contacts': [], 'next_cursor': None}
+                contacts = self.db.query(ORMContact).filter(ORMContact.id.in_(ids)).order_by(ORMContact.id).all()
                 result = []
                 for c in contacts:
                     result.append(Contact(
@@ -115,21 +284,34 @@ class ContactManager:
                         others=json.loads(c.others) if c.others else {},
                         id=c.id
                     ))
-                return {'success': True, 'contacts': result}
+                next_cursor = ids[-1] if ids and len(ids) == limit else None
+                return {'success': True, 'contacts': result, 'next_cursor': next_cursor}
             else:
                 return {'success': False, 'error': 'Either name or contact_id must be provided', 'manager': 'ContactBookletService'}
         except Exception as e:
             return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
 
-    def delete_contact(self, name: str):
+    def delete_contact(self, name: str, prefix: bool = False):
+        """
+        Delete every contact whose surname or forename equals name (case-insensitive).
+        
+        Args:
+            name: Surname or forename to delete
+            prefix: Also delete contacts whose surname or forename only starts with name
+            
+        Returns:
+            Dict with 'success', 'deleted' count and 'deleted_ids' (ascending), or 'error' message
+        """
+        if not name or not name.strip():
+            return {'success': False, 'error': 'A name is required', 'manager': 'ContactBookletService'}
         try:
-            contacts = self.db.query(ORMContact).filter(
-                (ORMContact.surname.ilike(f"%{name}%")) |
-                (ORMContact.forename.ilike(f"%{name}%"))
-            )
-            count = contacts.delete(synchronize_session=False)
+            # Select and delete in the same transaction so deleted_ids matches what was removed
+            name_filter = _name_prefix_filter(name) if prefix else _name_exact_filter(name)
+            ids = [row.id for row in self.db.query(ORMContact.id).filter(name_filter).order_by(ORMContact.id)]
+            if ids:
+                self.db.query(ORMContact).filter(ORMContact.id.in_(ids)).delete(synchronize_session=False)
             self.db.commit()
-            return {'success': True, 'deleted': count}
+            return {'success': True, 'deleted': len(ids), 'deleted_ids': ids}
         except Exception as e:
             self.db.rollback()
             return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
@@ -139,20 +321,39 @@ class ContactManager:
             db_contact = self.db.query(ORMContact).filter(ORMContact.id == contact_id).first()
             if not db_contact:
                 return {'success': False, 'error': 'Contact not found', 'manager': 'ContactBookletService'}
-            db_contact.surname = updated.surname
-            db_contact.forename = updated.forename
-            db_contact.other_names = json.dumps(updated.other_names)
-            db_contact.email = updated.email
-            db_contact.phone = updated.phone
-            db_contact.address = updated.address
-            db_contact.tags = json.dumps(updated.tags)
-            db_contact.others = json.dumps(updated.others)
+            for key, value in _column_values(updated).items():
+                setattr(db_contact, key, value)
             self.db.commit()
             return {'success': True}
         except Exception as e:
             self.db.rollback()
             return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
 
+    def update_contacts(self, updates: Dict[int, Contact]):
+        """
+        Update several contacts by ID in a single transaction.
+        
+        Args:
+            updates: Mapping of contact ID to its new values
+            
+        Returns:
+            Dict with 'success', 'updated' IDs and 'not_found' IDs, or 'error' message
+        """
+        try:
+            existing = {row.id for row in self.db.query(ORMContact.id).filter(ORMContact.id.in_(list(updates)))}
+            mappings = [{'id': contact_id, **_column_values(c)} for contact_id, c in updates.items() if contact_id in existing]
+            if mappings:
+                self.db.bulk_update_mappings(ORMContact, mappings)
+            self.db.commit()
+            return {
+                'success': True,
+                'updated': [m['id'] for m in mappings],
+                'not_found': [contact_id for contact_id in updates if contact_id not in existing]
+            }
+        except Exception as e:
+            self.db.rollback()
+            return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
+
     def get_contact_by_id(self, contact_id: int):
         """
         Get a single contact by its ID.
@@ -180,5 +381,31 @@ class ContactManager:
                 id=db_contact.id
             )
             return {'success': True, 'contact': contact}
+        except Exception as e:
+            return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
+
+    def get_contact_by_id_dict(self, contact_id: int):
+        """
+        Get a single contact by its ID as a plain dict, shaped like Contact.to_dict().
+        
+        Selects only the contact columns and builds the dict from the row, skipping the
+        ORM instance and Contact object; used by the MCP tools, which only serialize it.
+        
+        Args:
+            contact_id: The ID of the contact to retrieve
+            
+        Returns:
+            Dict with 'success' boolean and either 'contact' dict or 'error' message
+        """
+        try:
+            row = self.db.query(*_FIELD_COLUMNS).filter(ORMContact.id == contact_id).first()
+            if row is None:
+                return {'success': False, 'error': 'Contact not found', 'manager': 'ContactBookletService'}
+            
+            contact = row._asdict()
+            for key, empty in _JSON_FIELDS:
+                value = contact[key]
+                contact[key] = json.loads(value) if value else empty()
+            return {'success': True, 'contact': contact}
         except Exception as e:
             return {'success': False, 'error': str(e), 'manager': 'ContactBookletService'}
\ No newline at end of file
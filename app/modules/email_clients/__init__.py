@@ -8,10 +8,17 @@ Client management is now handled by the EmailAccountManager in utils.py
 """
 
 from .base_email_client import BaseEmailClient
-from .gmail_client_adapter import GmailClientAdapter
 # from .outlook_client_adapter import OutlookClientAdapter  # Uncomment when fully implemented
 
 __all__ = [
     'BaseEmailClient',
     'GmailClientAdapter'
 ]
+
+
+def __getattr__(name):
+    # The Gmail adapter imports the Google API client, so load it on first access
+    if name == 'GmailClientAdapter':
+        from .gmail_client_adapter import GmailClientAdapter
+        return GmailClientAdapter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
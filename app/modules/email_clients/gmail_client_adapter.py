@@ -35,7 +35,8 @@ class GmailClientAdapter(BaseEmailClient):
         
         Args:
             config: EmailConfig object containing account-specific configuration (required)
-            **kwargs: Additional keyword arguments for future extensibility
+            **kwargs: Additional keyword arguments; interactive=False disables the
+                      browser consent fallback when the saved token is unusable
         """
         super().__init__()
         self.config = config  # Store for future use if needed
@@ -56,7 +57,8 @@ class GmailClientAdapter(BaseEmailClient):
         # Initialize Gmail client with required account-specific paths
         self._gmail_client = GoogleGmailClient(
             credentials_path=credentials_path,
-            token_path=token_path
+            token_path=token_path,
+            interactive=kwargs.get('interactive', True)
         )
         self.logger = logging.getLogger(__name__)
     
@@ -1,4 +1,3 @@
-from googleapiclient.discovery import build
 from .google_base_client import GoogleBaseClient
 import datetime
 
@@ -7,7 +6,7 @@ class CalendarClient(GoogleBaseClient):
     def __init__(self):
         scopes = ["https://www.googleapis.com/auth/calendar"]
         super().__init__(scopes, service_name="Calendar")
-        self.service = build("calendar", "v3", credentials=self.creds)
+        self.service = self._build_service("calendar", "v3")
 
     def list_events(self, max_results: int = 10, time_min: datetime.datetime | None = None):
         now = (time_min or datetime.datetime.utcnow()).isoformat() + "Z"
@@ -1,11 +1,10 @@
-from googleapiclient.discovery import build
 from .google_base_client import GoogleBaseClient
 
 class DriveClient(GoogleBaseClient):
     def __init__(self):
         scopes = ["https://www.googleapis.com/auth/drive"]
         super().__init__(scopes, service_name="Drive")
-        self.service = build("drive", "v3", credentials=self.creds)
+        self.service = self._build_service("drive", "v3")
 
     def list_files(self, page_size: int = 10):
         resp = self.service.files().list(
@@ -1,5 +1,4 @@
 from .google_base_client import GoogleBaseClient
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from datetime import datetime, timedelta, timezone
 import base64
@@ -31,13 +30,14 @@ class GmailClient(GoogleBaseClient):
     All methods log errors using the configured logger.    
     """
     
-    def __init__(self, credentials_path: str, token_path: str):
+    def __init__(self, credentials_path: str, token_path: str, interactive: bool = True):
         """
         Initialize Gmail client with account-specific authentication paths.
         
         Args:
             credentials_path: Path to Google credentials JSON file (required)
             token_path: Path to Google token JSON file (required)
+            interactive: Allow the browser consent flow if the saved token is unusable
         """
         scopes = [
             "https://www.googleapis.com/auth/gmail.readonly",
@@ -47,15 +47,16 @@ class GmailClient(GoogleBaseClient):
             "https://www.googleapis.com/auth/gmail.labels"
         ]
         super().__init__(scopes, credentials_path=credentials_path, token_path=token_path, 
-                        service_name="Gmail")
-        self.service = build("gmail", "v1", credentials=self.creds)
+                        service_name="Gmail", interactive=interactive)
+        self.service = self._build_service("gmail", "v1")
         self.user_id = "me"  # Default to authenticated user
 
     # ========================================
     # MESSAGE RETRIEVAL AND LISTING METHODS
     # ========================================
 
-    def list_messages(self, max_results: int = 10, query: str = "", label_ids: List[str] = None) -> List[Dict]:
+    def list_messages(self, max_results: int = 10, query: str = "", label_ids: List[str] = None,
+                      fields: str = "messages(id,threadId)") -> List[Dict]:
         """
         List message IDs in the user's mailbox with optional query and label filtering.
         
@@ -63,6 +64,7 @@ class GmailClient(GoogleBaseClient):
             max_results: Maximum number of messages to return (default: 10)
             query: Gmail search query (e.g., 'is:unread', 'from:example@gmail.com')
             label_ids: List of label IDs to filter by
+            fields: Partial response selector; use 'messages/id' when only IDs are needed
             
         Returns:
             List of message objects with 'id' and 'threadId'
@@ -70,7 +72,8 @@ class GmailClient(GoogleBaseClient):
         try:
             params = {
                 "userId": self.user_id,
-                "maxResults": max_results
+                "maxResults": max_results,
+                "fields": fields
             }
             if query:
                 params["q"] = query
@@ -83,27 +86,66 @@ class GmailClient(GoogleBaseClient):
             self.logger.error(f"Gmail API error in list_messages: {error}")
             return []
 
-    def get_raw_message(self, msg_id: str, format: str = "full") -> Dict:
+    def get_raw_message(self, msg_id: str, format: str = "full", fields: Optional[str] = None) -> Dict:
         """
         Fetch the raw message by ID.
         
         Args:
             msg_id: The message ID
             format: Message format ('minimal', 'full', 'raw', 'metadata')
+            fields: Optional partial response selector (e.g. 'threadId,payload/headers')
             
         Returns:
             Raw message object from Gmail API
         """
+        extra = {"fields": fields} if fields else {}
         try:
             return self.service.users().messages().get(
                 userId=self.user_id, 
                 id=msg_id, 
-                format=format
+                format=format,
+                **extra
             ).execute()
         except HttpError as error:
             self.logger.error(f"Failed to get message {msg_id}: {error}")
             raise error
 
+    # Gmail accepts up to 100 calls per batch but rate-limits batches above 50
+    _BATCH_SIZE = 50
+
+    def get_raw_messages(self, msg_ids: List[str], format: str = "full",
+                         metadata_headers: List[str] = None) -> Dict[str, Dict]:
+        """
+        Fetch several raw messages with batched HTTP requests instead of one round-trip per ID.
+        
+        Args:
+            msg_ids: Message IDs to fetch
+            format: Message format ('minimal', 'full', 'raw', 'metadata')
+            metadata_headers: Headers to include when format is 'metadata' (e.g. ['Subject', 'From', 'Date'])
+            
+        Returns:
+            Dict mapping message ID to raw message object; IDs that failed are logged and omitted
+        """
+        results = {}
+
+        def collect(request_id, response, exception):
+            if exception is not None:
+                self.logger.error(f"Failed to get message {request_id}: {exception}")
+            else:
+                results[request_id] = response
+
+        messages = self.service.users().messages()
+        extra = {"metadataHeaders": metadata_headers} if format == "metadata" and metadata_headers else {}
+        for start in range(0, len(msg_ids), self._BATCH_SIZE):
+            batch = self.service.new_batch_http_request(callback=collect)
+            for msg_id in msg_ids[start:start + self._BATCH_SIZE]:
+                batch.add(
+                    messages.get(userId=self.user_id, id=msg_id, format=format, **extra),
+                    request_id=msg_id
+                )
+            batch.execute()
+        return results
+
     def get_formatted_message(self, raw_msg: Dict) -> Dict:
         """
         Format a raw Gmail API message for display.
@@ -335,7 +377,8 @@ class GmailClient(GoogleBaseClient):
         """
         try:
             # Get original message to extract headers
-            original = self.get_raw_message(msg_id)
+            # Only the headers and thread are used, so skip downloading the body
+            original = self.get_raw_message(msg_id, format="metadata", fields="threadId,payload/headers")
             headers = {h['name'].lower(): h['value'] for h in original['payload']['headers']}
             
             # Determine recipients
@@ -835,17 +878,19 @@ class GmailClient(GoogleBaseClient):
         """
         try:
             # Get message IDs matching the query
-            msg_ids = self.list_messages(max_results=max_results, query=query)
+            msg_ids = [msg['id'] for msg in self.list_messages(max_results=max_results, query=query, fields="messages/id")]
             
-            # Fetch and format each message
+            # Fetch all messages in batches, then format them in result order
+            raw_msgs = self.get_raw_messages(msg_ids)
             messages = []
-            for msg in msg_ids:
+            for msg_id in msg_ids:
+                raw_msg = raw_msgs.get(msg_id)
+                if raw_msg is None:
+                    continue
                 try:
-                    raw_msg = self.get_raw_message(msg['id'])
-                    formatted_msg = self.get_formatted_message(raw_msg)
-                    messages.append(formatted_msg)
+                    messages.append(self.get_formatted_message(raw_msg))
                 except Exception as e:
-                    self.logger.error(f"Failed to fetch message {msg['id']}: {e}")
+                    self.logger.error(f"Failed to fetch message {msg_id}: {e}")
                     
             return messages
         except HttpError as error:
@@ -874,7 +919,8 @@ class GmailClient(GoogleBaseClient):
             resp = self.service.users().messages().list(
                 userId=self.user_id,
                 q=query,
-                maxResults=max_results
+                maxResults=max_results,
+                fields="messages/id"
             ).execute()
             return resp.get("messages", []) or []
         except HttpError as error:
@@ -887,13 +933,18 @@ class GmailClient(GoogleBaseClient):
         Returns: List[dict] as returned by get_formatted_message
         """
         unread_msgs = self.list_unread(hours=hours, max_results=max_results, category=category)
+        msg_ids = [msg['id'] for msg in unread_msgs if msg.get('id')]
+        try:
+            raw_msgs = self.get_raw_messages(msg_ids)
+        except HttpError as error:
+            self.logger.error(f"Failed to fetch unread messages: {error}")
+            return []
         results = []
-        for msg in unread_msgs:
-            msg_id = msg.get('id')
-            if not msg_id:
+        for msg_id in msg_ids:
+            raw_msg = raw_msgs.get(msg_id)
+            if raw_msg is None:
                 continue
             try:
-                raw_msg = self.get_raw_message(msg_id)
                 formatted = self.get_formatted_message(raw_msg)
                 results.append(formatted)
             except Exception as e:
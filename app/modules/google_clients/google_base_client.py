@@ -2,12 +2,17 @@ from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google.auth.exceptions import RefreshError
+from googleapiclient.discovery import build
+from googleapiclient.http import HttpRequest, build_http
+from google_auth_httplib2 import AuthorizedHttp
 import os
+import threading
 import logging
 import json
 from typing import List, Optional
 from ... import config
 
+
 class GoogleBaseClient:
     """
     Base client for Google API services with enhanced OAuth 2.0 authentication.
@@ -40,7 +45,7 @@ class GoogleBaseClient:
     }
     
     def __init__(self, scopes: List[str], credentials_path: str, token_path: str, 
-                 service_name: Optional[str] = None):
+                 service_name: Optional[str] = None, interactive: bool = True):
         """
         Initialize the Google Base Client with OAuth authentication.
         
@@ -49,6 +54,8 @@ class GoogleBaseClient:
             credentials_path: Path to Google credentials JSON file (required)
             token_path: Path to Google token JSON file (required)
             service_name: Optional service name for logging (e.g., 'Gmail', 'Calendar')
+            interactive: Whether to fall back to the browser consent flow when the saved
+                         token cannot be used or refreshed; if False, RuntimeError is raised instead
         """
         self.config = config
         self.logger = logging.getLogger(f"{__name__}.{service_name or 'GoogleClient'}")
@@ -59,12 +66,42 @@ class GoogleBaseClient:
         # Store required account-specific paths
         self.credentials_path = credentials_path
         self.token_path = token_path
+        self.interactive = interactive
+        # One authorized Http per thread: httplib2 connections are not thread-safe
+        self._thread_http = threading.local()
         
         self.logger.info(f"Initializing {self.service_name} client with scopes: {self.scopes}")
         self.logger.info(f"Using credentials: {self.credentials_path}")
         self.logger.info(f"Using token: {self.token_path}")
         self._authenticate()
         
+    def _build_service(self, api: str, version: str):
+        """
+        Build an API service object from the discovery document bundled with
+        google-api-python-client, so no discovery request goes over the network.
+        
+        Requests built by the service run on the calling thread's own Http (see
+        _request_builder), so the service can be used from worker threads.
+        
+        Args:
+            api: API name (e.g., 'gmail', 'calendar', 'drive')
+            version: API version (e.g., 'v1')
+        """
+        return build(api, version, credentials=self.creds, requestBuilder=self._request_builder,
+                     static_discovery=True)
+    
+    def _request_builder(self, http, *args, **kwargs) -> HttpRequest:
+        """Build an API request bound to the current thread's Http instead of the shared one."""
+        return HttpRequest(self._http_for_thread(), *args, **kwargs)
+    
+    def _http_for_thread(self) -> AuthorizedHttp:
+        """Return this thread's authorized Http, creating it on the thread's first request."""
+        http = getattr(self._thread_http, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self.creds, http=build_http())
+            self._thread_http.http = http
+        return http
+    
     def _authenticate(self):
         """
         Authenticate with Google APIs using OAuth 2.0 flow.
@@ -87,6 +124,11 @@ class GoogleBaseClient:
             
             # Step 3: Start OAuth flow if we still don't have valid credentials
             if not self.creds or not self.creds.valid:
+                if not self.interactive:
+                    raise RuntimeError(
+                        f"{self.service_name} token at {self.token_path} is missing or invalid "
+                        "and interactive authorization is disabled"
+                    )
                 self._start_oauth_flow()
 
         # Step 4: Save valid credentials
@@ -194,6 +236,8 @@ class GoogleBaseClient:
         try:
             self._cleanup_invalid_token()  # Force re-authentication
             self._authenticate()
+            # Per-thread Http objects were authorized with the old credentials
+            self._thread_http = threading.local()
             return True
         except Exception as e:
             self.logger.error(f"Failed to add scopes: {e}")
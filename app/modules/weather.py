@@ -1,9 +1,39 @@
 import aiohttp
 import asyncio
 import json
-from typing import Any, Dict, Tuple
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple, Union
 import logging
-from .. import config
+from ..config import get_config
+from ..http import get_http_client
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# (temperature key, feels-like key, display unit) for a temperature unit, e.g. ("temp_c", "feelslike_c", "°C")
+UnitKeys = Tuple[str, str, str]
+
+_ACCEPT_JSON = {'Accept': 'application/json'}
+
+class WeatherMode(IntEnum):
+    """WeatherAPI endpoints; the value indexes the module formatter table."""
+    CURRENT = 0
+    FORECAST = 1
+    HISTORY = 2
+    SEARCH = 3
+
+    @classmethod
+    def parse(cls, mode: Union[str, "WeatherMode"]) -> "WeatherMode":
+        """Convert a mode name such as 'current' to a WeatherMode, raising ValueError if unknown."""
+        if isinstance(mode, cls):
+            return mode
+        try:
+            return cls[mode.upper()]
+        except (KeyError, AttributeError):
+            raise ValueError(f"mode not supported: {mode}") from None
 
 class FetchWeather:
     base_url: str
@@ -13,51 +43,57 @@ class FetchWeather:
     timeout: int
     logger: Any
 
-    def __init__(self):
-        self.config = config
+    __slots__ = (
+        "config", "logger", "base_url", "api_key", "lang", "temp_unit", "timeout",
+        "_unit_keys", "_endpoints", "_base_params", "_timeout"
+    )
+
+    def __init__(self, config=None):
+        self.config = config if config is not None else get_config()
         self.logger = logging.getLogger(__name__)
         self.base_url = self.config.weather_url
         self.api_key = self.config.weather_api_key
         self.lang = self.config.lang
         self.temp_unit = self.config.temp_unit
+        # Response keys and display unit for the configured temperature unit, built once
+        unit = self.temp_unit.lower()
+        self._unit_keys: UnitKeys = (f"temp_{unit}", f"feelslike_{unit}", f"°{unit.upper()}")
         self.timeout = self.config.timeout
+        # Per-request constants: endpoint URL per mode (indexed like _FORMATTERS) and the base query
+        self._endpoints = tuple(f"{self.base_url}/{m.name.lower()}.json" for m in WeatherMode)
+        self._base_params = {"key": self.api_key, "lang": self.lang, "aqi": "yes"}
+        self._timeout = aiohttp.ClientTimeout(total=self.timeout)
 
         if not self.api_key:
             raise ValueError("api key was Not Found")
         if not self.base_url:
             raise ValueError("Weather base url is not provided")
     
-    async def fetch_weather(self, session: aiohttp.ClientSession, q: str, mode: str = "current", format=True, **extra_params) -> Dict[str, Any]:
-        if mode not in ('current', 'forecast', 'search', 'history'):
-            raise ValueError("model not supported")
+    async def fetch_weather(self, session: Optional[aiohttp.ClientSession], q: str, mode: Union[str, WeatherMode] = WeatherMode.CURRENT, format=True, **extra_params) -> Dict[str, Any]:
+        """
+        Fetch weather data for a query.
+
+        Args:
+            session: aiohttp session to use; None uses the process-wide shared session
+        """
+        mode = WeatherMode.parse(mode)
+        if session is None:
+            session = get_http_client().session
         
-        endpoint = f"{self.base_url}/{mode}.json"
-        headers = {'Accept': 'application/json'}
-        params = {
-            "key": self.api_key,
-            "q": q,
-            "lang": self.lang,
-            "aqi": "yes",
-            **extra_params
-        }
+        params = {**self._base_params, "q": q, **extra_params}
         try:
-            async with session.get(endpoint, params=params,
-                                   timeout=aiohttp.ClientTimeout(total=self.timeout),
-                                   headers=headers) as resp:
+            async with session.get(self._endpoints[mode], params=params,
+                                   timeout=self._timeout,
+                                   headers=_ACCEPT_JSON) as resp:
                 resp.raise_for_status()
-                raw = await resp.json()
-                
-                if format:
-                    if mode == "current" or mode == "forecast":                    
-                        return self._format_normal(raw)
-                    elif mode == "history":
-                        return self._format_at(raw)
-                else:
-                    return raw
+                body = await resp.read()
+            
+            return _format_weather(body, mode, self._unit_keys, format)
                 
-        except asyncio.TimeoutError:
-            self.logger.error("Timeout while fetching weather data for city: %s", q)
-            return {"error": "Request timed out"}
+        except (asyncio.TimeoutError, aiohttp.ClientConnectionError):
+            # Transient network failures are retried by the service layer
+            self.logger.warning("Transient error while fetching weather data for city: %s", q)
+            raise
         
         except aiohttp.ClientError as e:
             self.logger.error("Client error while fetching weather data for city: %s", q)
@@ -71,64 +107,81 @@ class FetchWeather:
             self.logger.error("Unexpected error while fetching weather data for city: %s", q)
             return {"error": str(e)}
 
-    def _format_normal(self, raw: Dict[str, Any]) ->Dict[str, Any]:
-        current = raw.get('current', {})
-        location = raw.get('location', {})
-        temp_unit = self.temp_unit.lower()
-        temp_key = f'temp_{temp_unit}'
-        feelslike_key = f'feelslike_{temp_unit}'
-
-        return {
-            "city": location.get('name'),
-            "region": location.get('region'),
-            "country": location.get('country'),
-            "last-updated": current.get('last_updated'),
-            "current_weather": current.get('condition', {}).get('text'),
-            "temperature": current.get(temp_key, current.get('temp_c')),
-            "feels_like": current.get(feelslike_key, current.get('feelslike_c')),
-            "humidity": current.get('humidity'),
-            "wind_speed": current.get('wind_kph'),
-            "wind_direction": current.get('wind_dir'),
-            "visibility": current.get("vis_km"),
-            "uv": current.get("uv"),
-            "air_quality": self._format_air_quality(current.get('air_quality', {})),            
-            "unit": f"°{temp_unit.upper()}"
-        }
 
-    def _format_at(self, raw: Dict[str, Any]) ->Dict[str, Any]:
-        """
-        Format the raw weather data returned by get_weather_at for past, present, and future dates.
-        """
-        if not raw or "location" not in raw or "forecast" not in raw:
-            return {"error": "Invalid weather data"}
-
-        location = raw["location"]
-        forecast_days = raw["forecast"].get("forecastday", [])
-        if not forecast_days:
-            return {"error": "No forecast data available"}
-
-        # Always use the first (and usually only) forecastday
-        day_data = forecast_days[0]
-        result = {
-            "city": location.get("name"),
-            "region": location.get("region"),
-            "country": location.get("country"),
-            "date": day_data.get("date"),
-            "day": day_data.get("day", {}),
-            "astro": day_data.get("astro", {}),
-            "hourly": day_data.get("hour", []),
-        }
-        return result
-        
-    def _format_air_quality(self, air_quality: Dict[str, Any]) -> Dict[str, Any]:
-        return {
-            "pm2_5": air_quality.get("pm2_5"),
-            "pm10": air_quality.get("pm10")
-        }
-    
+def _format_air_quality(air_quality: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "pm2_5": air_quality.get("pm2_5"),
+        "pm10": air_quality.get("pm10")
+    }
+
+def _format_normal(raw: Dict[str, Any], unit_keys: UnitKeys) -> Dict[str, Any]:
+    current = raw.get('current', {})
+    location = raw.get('location', {})
+    temp_key, feelslike_key, unit = unit_keys
+
+    return {
+        "city": location.get('name'),
+        "region": location.get('region'),
+        "country": location.get('country'),
+        "last-updated": current.get('last_updated'),
+        "current_weather": current.get('condition', {}).get('text'),
+        "temperature": current.get(temp_key, current.get('temp_c')),
+        "feels_like": current.get(feelslike_key, current.get('feelslike_c')),
+        "humidity": current.get('humidity'),
+        "wind_speed": current.get('wind_kph'),
+        "wind_direction": current.get('wind_dir'),
+        "visibility": current.get("vis_km"),
+        "uv": current.get("uv"),
+        "air_quality": _format_air_quality(current.get('air_quality', {})),            
+        "unit": unit
+    }
+
+def _format_at(raw: Dict[str, Any], unit_keys: UnitKeys) -> Dict[str, Any]:
+    """
+    Format the raw weather data returned by get_weather_at for past, present, and future dates.
+    """
+    if not raw or "location" not in raw or "forecast" not in raw:
+        return {"error": "Invalid weather data"}
+
+    location = raw["location"]
+    forecast_days = raw["forecast"].get("forecastday", [])
+    if not forecast_days:
+        return {"error": "No forecast data available"}
+
+    # Always use the first (and usually only) forecastday
+    day_data = forecast_days[0]
+    result = {
+        "city": location.get("name"),
+        "region": location.get("region"),
+        "country": location.get("country"),
+        "date": day_data.get("date"),
+        "day": day_data.get("day", {}),
+        "astro": day_data.get("astro", {}),
+        "hourly": day_data.get("hour", []),
+    }
+    return result
+
+# Formatter for each WeatherMode, indexed by mode value; None returns the raw payload
+_FORMATTERS = (
+    _format_normal,     # CURRENT
+    _format_normal,     # FORECAST
+    _format_at,         # HISTORY
+    None,               # SEARCH
+)
+
+def _format_weather(body: bytes, mode: WeatherMode, unit_keys: UnitKeys, format: bool = True) -> Dict[str, Any]:
+    """
+    Decode a WeatherAPI response body and apply the formatter for its mode.
+    """
+    raw = _json_loads(body)
+    formatter = _FORMATTERS[mode] if format else None
+    if formatter is not None:
+        return formatter(raw, unit_keys)
+    return raw
+
 class Location:
-    def __init__(self):
-        self.config = config
+    def __init__(self, config=None):
+        self.config = config if config is not None else get_config()
         self.logger = logging.getLogger(__name__)
 
     
@@ -138,20 +191,18 @@ class Location:
         Returns a coordinate in string.
         
         Args:
-            session: An optional aiohttp.ClientSession. If not provided, a new one will be created.
+            session: An optional aiohttp.ClientSession. If not provided, the process-wide shared session is used.
         """
-        close_session = False
         headers = {
             'Accept': 'application/json'
         }
         try:
             if session is None:
-                session = aiohttp.ClientSession()
-                close_session = True
+                session = get_http_client().session
 
             async with session.get("https://ipinfo.io", timeout=aiohttp.ClientTimeout(total=self.config.timeout), headers=headers) as resp:
                 resp.raise_for_status()
-                data = await resp.json()
+                data = _json_loads(await resp.read())
                 return data.get("loc", None)
             
         except aiohttp.ClientError as e:
@@ -161,11 +212,27 @@ class Location:
         except Exception as e:
             self.logger.error("Unexpected error getting location: %s", str(e))
             return "unknown"
-        
-        finally:
-            if close_session and session is not None:
-                await session.close()
 
 
+# Process-wide instances shared by every WeatherService
+_fetcher_singleton: Optional[FetchWeather] = None
+_location_singleton: Optional[Location] = None
+
+def get_fetcher() -> FetchWeather:
+    """Return the shared FetchWeather instance, creating it on first use."""
+    global _fetcher_singleton
+    if _fetcher_singleton is None:
+        _fetcher_singleton = FetchWeather()
+    return _fetcher_singleton
 
+def reset_fetcher() -> None:
+    """Drop the shared FetchWeather so the next use picks up a reloaded config."""
+    global _fetcher_singleton
+    _fetcher_singleton = None
 
+def get_location() -> Location:
+    """Return the shared Location instance, creating it on first use."""
+    global _location_singleton
+    if _location_singleton is None:
+        _location_singleton = Location()
+    return _location_singleton
@@ -2,9 +2,11 @@
 Calendar Service - High-level calendar operations
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 import datetime
-from ..modules.google_clients.calendar_client import CalendarClient
+
+if TYPE_CHECKING:
+    from ..modules.google_clients.calendar_client import CalendarClient
 
 
 class CalendarService:
@@ -17,9 +19,11 @@ class CalendarService:
         self._calendar_client = None
     
     @property
-    def calendar_client(self) -> CalendarClient:
+    def calendar_client(self) -> "CalendarClient":
         """Lazy initialization of Calendar client"""
         if self._calendar_client is None:
+            # Imported here so the Google API client loads only when calendar is used
+            from ..modules.google_clients.calendar_client import CalendarClient
             self._calendar_client = CalendarClient()
         return self._calendar_client
     
@@ -2,8 +2,10 @@
 Drive Service - High-level Google Drive operations
 """
 
-from typing import List, Dict, Any
-from ..modules.google_clients.drive_client import DriveClient
+from typing import List, Dict, Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from ..modules.google_clients.drive_client import DriveClient
 
 
 class DriveService:
@@ -16,9 +18,11 @@ class DriveService:
         self._drive_client = None
     
     @property
-    def drive_client(self) -> DriveClient:
+    def drive_client(self) -> "DriveClient":
         """Lazy initialization of Drive client"""
         if self._drive_client is None:
+            # Imported here so the Google API client loads only when drive is used
+            from ..modules.google_clients.drive_client import DriveClient
             self._drive_client = DriveClient()
         return self._drive_client
     
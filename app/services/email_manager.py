@@ -12,6 +12,7 @@ Features:
 - Provider-agnostic operations across accounts
 """
 
+import asyncio
 import logging
 from typing import Dict, List, Optional, Any, Union
 from ..config import Config
@@ -95,6 +96,15 @@ class EmailManager:
             # If client doesn't exist, create it
             return self.account_manager.create_email_client(account_name)
     
+    def warm_up_clients(self):
+        """
+        Start creating clients for enabled accounts in the background.
+        
+        Returns:
+            Future that resolves once the warm-up has finished
+        """
+        return self.account_manager.warm_up_clients()
+    
     def get_default_account(self) -> str:
         """
         Get the name of the default email account.
@@ -309,6 +319,45 @@ class EmailManager:
         
         return all_counts
     
+    async def count_all_unread_messages_async(self, timeout: Optional[float] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Count unread messages across all enabled accounts concurrently.
+        
+        Each account is counted in a worker thread, so total latency is that of the
+        slowest provider rather than the sum of all of them. Google clients give each
+        thread its own Http, so the workers do not share connections with the loop thread.
+        
+        A timed-out account reports an error, but its worker thread is not cancelled:
+        it runs to completion in the background and its result is discarded.
+        
+        Args:
+            timeout: Per-account limit in seconds (defaults to config.timeout)
+            
+        Returns:
+            Dict mapping account names to unread count information
+        """
+        if timeout is None:
+            timeout = self.config.timeout
+        accounts = self.available_accounts
+        
+        async def count(account_name: str) -> Dict[str, Any]:
+            try:
+                return await asyncio.wait_for(
+                    asyncio.to_thread(self.count_unread_messages, account=account_name),
+                    timeout
+                )
+            except asyncio.TimeoutError:
+                self.logger.warning(f"Timed out counting unread messages for account '{account_name}'")
+                return {
+                    'success': False,
+                    'error': f'Timed out after {timeout}s',
+                    'account': account_name,
+                    'count': 0
+                }
+        
+        results = await asyncio.gather(*(count(name) for name in accounts))
+        return dict(zip(accounts, results))
+    
     # ========================================
     # ACCOUNT MANAGEMENT METHODS
     # ========================================
@@ -5,9 +5,20 @@ This service abstracts weather operations and provides a stable API
 regardless of the underlying weather provider (OpenWeatherMap, etc.)
 """
 
+from dataclasses import dataclass
 from typing import Optional, Tuple, Dict, Any, Union
+import asyncio
+import functools
+import time
 import aiohttp
-from ..modules.weather import FetchWeather, Location
+from ..http import HttpClient
+from ..modules.weather import FetchWeather, Location, WeatherMode, get_fetcher, get_location
+
+
+@dataclass(slots=True)
+class LocationErr:
+    """Failure result of location resolution."""
+    message: str
 
 
 class WeatherService:
@@ -19,31 +30,46 @@ class WeatherService:
     - Multiple weather modes (current, forecast, history, search)
     - Consistent error handling
     - Provider-agnostic interface
+    - Request coalescing: concurrent identical queries share one upstream call
+    - Short-lived response cache: repeated queries within the mode's TTL skip the network
     """
     
-    def __init__(self, config):
+    __slots__ = ("config", "http", "_inflight", "_cache")
+    
+    # Retry policy for transient upstream failures (timeouts, dropped connections)
+    _RETRY_ATTEMPTS = 3
+    _RETRY_BACKOFF = 0.25
+    
+    # Seconds a successful response stays fresh, indexed by WeatherMode value;
+    # current conditions change within minutes, past days never do
+    _CACHE_TTL = (60.0, 900.0, 3600.0, 3600.0)
+    _CACHE_MAX_ENTRIES = 256
+    # Clock for cache expiry; a builtin, so it is not bound as a method
+    _clock = time.monotonic
+    
+    def __init__(self, config, http: HttpClient):
         self.config = config
-        self._weather_fetcher = None
-        self._location_service = None
+        # Process-wide HTTP client; its session is shared with other services
+        self.http = http
+        # In-flight upstream calls keyed by (target, mode, format, lang, temp unit, extra params)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        # Successful responses under the same key, as (expires_at, result)
+        self._cache: Dict[tuple, Tuple[float, Dict[str, Any]]] = {}
     
     @property
     def weather_fetcher(self) -> FetchWeather:
-        """Lazy initialization of weather fetcher"""
-        if self._weather_fetcher is None:
-            self._weather_fetcher = FetchWeather()
-        return self._weather_fetcher
+        """Process-wide weather fetcher, lazily initialized"""
+        return get_fetcher()
     
     @property 
     def location_service(self) -> Location:
-        """Lazy initialization of location service"""
-        if self._location_service is None:
-            self._location_service = Location()
-        return self._location_service
+        """Process-wide location service, lazily initialized"""
+        return get_location()
     
     async def get_weather(
         self, 
         q: Optional[str] = None, 
-        mode: str = "current",
+        mode: Union[str, WeatherMode] = WeatherMode.CURRENT,
         format: bool = True,
         **others: Any
     ) -> Dict[str, Any]:
@@ -52,35 +78,91 @@ class WeatherService:
         
         Args:
             q: search query. see "https://www.weatherapi.com/docs/" If None, uses config location or IP lookup
-            mode: Weather mode - 'current', 'forecast', 'search', 'history'; forecast and history need additional params
+            mode: Weather mode - a WeatherMode or one of 'current', 'forecast', 'search', 'history';
+                forecast and history need additional params
             
         Returns:
             Success: A dictionary of returned weather information
             Error: A dictionary {"error": ${error message}}
         """
         try:
+            # Reject unknown modes before any network work is started
+            mode = WeatherMode.parse(mode)
+            
             # Determine location
             target = await self._resolve_location(q)
-            if target == "unknown":
-                return {"error": "Location can not be determined"}
+            if isinstance(target, LocationErr):
+                return {"error": target.message}
             
-            # Fetch weather data
-            async with aiohttp.ClientSession() as session:
-                info = await self.weather_fetcher.fetch_weather(
-                    session, target, mode, format, **others
-                )
-                return info
+            # Language and unit shape the formatted result, so a config change must miss the cache
+            fetcher = self.weather_fetcher
+            key = (target, mode, format, fetcher.lang, fetcher.temp_unit, tuple(sorted(others.items())))
+            cached = self._cache.get(key)
+            if cached is not None and cached[0] > self._clock():
+                return cached[1]
+            
+            # Join an identical in-flight request instead of issuing another one
+            pending = self._inflight.get(key)
+            if pending is None:
+                pending = asyncio.ensure_future(self._fetch(target, mode, format, others))
+                self._inflight[key] = pending
+                pending.add_done_callback(functools.partial(self._settle, key))
+            # Shield so one cancelled caller does not cancel the shared fetch
+            return await asyncio.shield(pending)
                 
         except Exception as e:
             error_msg = f"Weather service error: {str(e)}"
             return {"error": error_msg}
     
-    async def _resolve_location(self, q: Optional[str]) -> str:
+    def _settle(self, key: tuple, task: asyncio.Future) -> None:
+        """Retire a finished upstream call and cache its result if it succeeded."""
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if "error" in result:
+            return
+        
+        now = self._clock()
+        if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+            # Drop expired entries first, then the oldest if still full
+            self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+            if len(self._cache) >= self._CACHE_MAX_ENTRIES:
+                self._cache.pop(next(iter(self._cache)))
+        # Re-insert so iteration order stays oldest-first
+        self._cache.pop(key, None)
+        self._cache[key] = (now + self._CACHE_TTL[key[1]], result)
+    
+    async def _fetch(self, target: str, mode: WeatherMode, format: bool, others: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Perform the upstream weather request for a resolved location.
+        
+        Each attempt is bounded by the configured timeout; timeouts and dropped
+        connections are retried with exponential backoff before giving up.
+        """
+        error = "Request failed"
+        for attempt in range(self._RETRY_ATTEMPTS):
+            try:
+                return await asyncio.wait_for(
+                    self.weather_fetcher.fetch_weather(
+                        self.http.session, target, mode, format, **others
+                    ),
+                    timeout=self.config.timeout
+                )
+            except asyncio.TimeoutError:
+                error = "Request timed out"
+            except aiohttp.ClientConnectionError as e:
+                error = str(e)
+            if attempt < self._RETRY_ATTEMPTS - 1:
+                await asyncio.sleep(self._RETRY_BACKOFF * 2 ** attempt)
+        return {"error": error}
+    
+    async def _resolve_location(self, q: Optional[str]) -> Union[str, LocationErr]:
         """
         Resolve the target location using priority: provided -> config -> IP lookup
         
         Returns:
-            coordinate as a string
+            coordinate as a string, or LocationErr if no location could be determined
         """
         # 1. Use provided location if available
         if q:
@@ -92,7 +174,9 @@ class WeatherService:
             return config_location
         
         # 3. Fallback to IP-based location detection
-        coordinates = await self.location_service.get_location_by_ip()
+        coordinates = await self.location_service.get_location_by_ip(self.http.session)
+        if not coordinates or coordinates == "unknown":
+            return LocationErr("Location can not be determined")
         return coordinates
     
     async def weather_at(self, timestamp, query: Optional[str] = None) -> Dict[str, Any]:
@@ -102,12 +186,25 @@ class WeatherService:
         Args:
             A time Stamp in format yyyy-MM-dd
         """
-        return await self.get_weather(query, "history", dt=timestamp)
+        return await self.get_weather(query, WeatherMode.HISTORY, dt=timestamp)
     
-    async def get_forecast(self, days: int, query: Optional[str] = None) -> Dict[str, Any]:
-        """Get weather forecast, format is set to True"""
+    @staticmethod
+    def validate_forecast(days: int) -> Optional[Dict[str, Any]]:
+        """
+        Check the forecast range without scheduling any async work.
+        
+        Returns:
+            None if days is valid, otherwise an error dictionary
+        """
         if days < 1 or days > 14:
             return {"error": "Forecast days must be in a proper range, 1 - 14"}
-        return await self.get_weather(query, "forecast", days=days)
+        return None
+    
+    async def get_forecast(self, days: int, query: Optional[str] = None) -> Dict[str, Any]:
+        """Get weather forecast, format is set to True"""
+        error = self.validate_forecast(days)
+        if error is not None:
+            return error
+        return await self.get_weather(query, WeatherMode.FORECAST, days=days)
     
 
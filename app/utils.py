@@ -1,10 +1,62 @@
 from pathlib import Path
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import functools
+import io
 import json
+from operator import attrgetter
 import logging
-from typing import Dict, Optional, List, Any
+import os
+import stat
+import sys
+import tempfile
+import threading
+from typing import Callable, Dict, Optional, List, Any, Final, Tuple
+
+from dotenv import dotenv_values
 
 from .config import EmailAccountConfig
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Resolved once at import so hot paths do not hit the filesystem to find them
+_APP_DIR: Final[Path] = Path(__file__).resolve().parent
+_ENV_PATH: Final[Path] = _APP_DIR / ".env"
+_ACCOUNTS_JSON_PATH: Final[Path] = _APP_DIR / "email_accounts.json"
+_SECRETS_DIR: Final[Path] = _APP_DIR / "secrets"
+
+# Stands in for a field an account config does not have
+_MISSING = object()
+
+# Flag getters bound once for the account scan loops
+_is_enabled = attrgetter('enabled')
+_is_default = attrgetter('default_account')
+
+
+@functools.cache
+def _get_base_email_client() -> type:
+    """Import BaseEmailClient once; ImportError is not cached and propagates."""
+    from .modules.email_clients.base_email_client import BaseEmailClient
+    return BaseEmailClient
+
+
+@functools.cache
+def _get_gmail_client_adapter() -> type:
+    """Import GmailClientAdapter once; ImportError is not cached and propagates."""
+    from .modules.email_clients.gmail_client_adapter import GmailClientAdapter
+    return GmailClientAdapter
+
 
 class EmailConfig:
     """
@@ -12,6 +64,14 @@ class EmailConfig:
     Contains only email-related settings, replacing the complex ClientConfig.
     """
     
+    __slots__ = (
+        'account_name', 'provider', 'display_name', 'enabled', 'default_account',
+        'google_credentials_path', 'google_token_path',
+        'outlook_tenant_id', 'outlook_client_id', 'outlook_client_secret',
+        'imap_server', 'imap_port', 'smtp_server', 'smtp_port', 'username', 'password',
+        'security_key', 'timeout', 'log_level', 'user_agent'
+    )
+    
     def __init__(self, account_config: EmailAccountConfig, base_config=None):
         """
         Initialize with account configuration and optional base config.
@@ -44,12 +104,18 @@ class EmailConfig:
         self.username = account_config.username
         self.password = account_config.password
         
-        # Basic settings from base config if available
-        if base_config:
-            self.security_key = getattr(base_config, 'security_key', None)
-            self.timeout = getattr(base_config, 'timeout', 10)
-            self.log_level = getattr(base_config, 'log_level', 'INFO')
-            self.user_agent = getattr(base_config, 'user_agent', None)
+        # Basic settings from base config if available; every slot is always
+        # assigned, so without a base config the Config defaults apply
+        if base_config is not None:
+            self.security_key = base_config.security_key
+            self.timeout = base_config.timeout
+            self.log_level = base_config.log_level
+            self.user_agent = base_config.user_agent
+        else:
+            self.security_key = None
+            self.timeout = 10
+            self.log_level = 'INFO'
+            self.user_agent = None
 
 
 class EmailAccountManager:
@@ -65,6 +131,14 @@ class EmailAccountManager:
     - Simplified config: Uses single EmailConfig instead of complex ClientConfig
     """
     
+    # Account fields a live client depends on; updating any other field keeps the cached client
+    _CLIENT_AFFECTING_FIELDS = frozenset({
+        "provider", "enabled",
+        "google_credentials_path", "google_token_path",
+        "outlook_tenant_id", "outlook_client_id", "outlook_client_secret",
+        "imap_server", "imap_port", "smtp_server", "smtp_port", "username", "password"
+    })
+    
     def __init__(self, config=None):
         """
         Initialize the EmailAccountManager.
@@ -78,42 +152,132 @@ class EmailAccountManager:
         # Cache for account configurations (loaded on init)
         self._account_configs: Dict[str, Any] = {}
         
+        # Enabled account names in insertion order, recomputed whenever accounts change
+        self._enabled_names: List[str] = []
+        
+        # Name of the default account, recomputed whenever accounts change
+        self._default_account_name: Optional[str] = None
+        # Name of the account carrying default_account=True (may be disabled)
+        self._default_flag_name: Optional[str] = None
+        
         # Cache for email client instances (lazy-loaded)
         self._email_clients: Dict[str, Any] = {}
+        # Per-account locks serializing creation of that account's client, so a request
+        # waits for an in-progress warm-up of the same account but never for another one
+        self._client_locks: Dict[str, threading.Lock] = {}
+        # Guards _client_locks only; never held while a client is built
+        self._client_lock = threading.Lock()
+        
+        # EmailConfig per account name, dropped whenever accounts change
+        self._email_configs: Dict[str, EmailConfig] = {}
         
         # Available email providers
         self._available_providers: Dict[str, type] = {}
         
-        # Path to email accounts JSON file
-        self._accounts_file_path = Path(__file__).parent / "email_accounts.json"
+        # Built-in providers whose client class is imported on first use
+        self._provider_factories: Dict[str, Callable[[], type]] = {}
+        
+        # Path to email accounts JSON file; its directory is created once here
+        self._accounts_file_path = _ACCOUNTS_JSON_PATH
+        _ensure_directory_once(self._accounts_file_path.parent)
+        
+        # Bytes last written to the accounts file, used to skip no-op saves
+        self._last_saved_blob: Optional[bytes] = None
+        
+        # Nesting depth of batch_updates() and whether a save was deferred inside it
+        self._batch_depth = 0
+        self._save_pending = False
         
         self._initialize_default_providers()
         self._load_account_configs()
     
     def _initialize_default_providers(self):
-        """Initialize default email providers."""
+        """Initialize default email providers without importing their client libraries."""
+        self._provider_factories['gmail'] = _get_gmail_client_adapter
+        self.logger.info("Initialized default email providers: gmail")
+    
+    def _resolve_provider(self, provider: str) -> Optional[type]:
+        """
+        Return the client class for a provider, importing built-in providers on first use.
+        
+        Args:
+            provider: Lower-case provider name
+            
+        Returns:
+            Client class, or None if the provider is unknown or fails to import
+        """
+        client_class = self._available_providers.get(provider)
+        if client_class is not None:
+            return client_class
+        
+        factory = self._provider_factories.get(provider)
+        if factory is None:
+            return None
         try:
-            from .modules.email_clients.base_email_client import BaseEmailClient
-            from .modules.email_clients.gmail_client_adapter import GmailClientAdapter
-            self._available_providers['gmail'] = GmailClientAdapter
-            self.logger.info("Initialized default email providers: gmail")
+            client_class = factory()
         except ImportError as e:
-            self.logger.warning(f"Failed to initialize default providers: {e}")
+            self.logger.warning("Failed to load email provider '%s': %s", provider, e)
+            return None
+        self._available_providers[provider] = client_class
+        return client_class
     
     def _load_account_configs(self):
         """Load account configurations from JSON file on initialization."""
         self._account_configs = self.load_accounts_from_file(self._accounts_file_path)
-        self.logger.info(f"Loaded {len(self._account_configs)} account configurations")
+        self._refresh_account_caches()
+        self.logger.info("Loaded %s account configurations", len(self._account_configs))
+    
+    def _refresh_account_caches(self):
+        """Recompute the cached enabled and default account names after accounts change."""
+        # A default swap touches other accounts too, so drop every derived EmailConfig
+        self._email_configs.clear()
+        self._enabled_names = self.list_enabled_accounts(self._account_configs)
+        self._default_account_name = self.get_default_account_name_static(self._account_configs)
+        self._default_flag_name = next(
+            (name for name, config in self._account_configs.items() if _is_default(config)), None
+        )
     
     def _save_account_configs(self):
-        """Auto-save account configurations to JSON file."""
-        success = self.save_accounts_to_file(self._account_configs, self._accounts_file_path)
+        """Auto-save account configurations to JSON file, skipping unchanged content."""
+        if self._batch_depth:
+            # Written once when the outermost batch_updates() block exits
+            self._save_pending = True
+            return True
+        blob = self.serialize_accounts(self._account_configs)
+        if blob == self._last_saved_blob:
+            self.logger.debug("Account configurations unchanged, skipping auto-save")
+            return True
+        success = self.save_accounts_to_file(self._account_configs, self._accounts_file_path, blob)
         if success:
+            self._last_saved_blob = blob
             self.logger.info("Account configurations auto-saved successfully")
         else:
             self.logger.error("Failed to auto-save account configurations")
         return success
     
+    @contextmanager
+    def batch_updates(self):
+        """
+        Group several account changes into a single write of the accounts file.
+        
+        Inside the block add_account, delete_account and update_account only
+        change the in-memory configs; the file is written once on exit, even
+        if the block raises, so disk always matches memory afterwards.
+        
+        Example:
+            with manager.batch_updates():
+                manager.add_account(work)
+                manager.update_account("work", {"default_account": True})
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._save_pending:
+                self._save_pending = False
+                self._save_account_configs()
+    
     def register_provider(self, name: str, client_class: type):
         """
         Register a new email provider.
@@ -126,14 +290,14 @@ class EmailAccountManager:
             TypeError: If client_class doesn't implement BaseEmailClient
         """
         try:
-            from .modules.email_clients.base_email_client import BaseEmailClient
+            BaseEmailClient = _get_base_email_client()
             if not issubclass(client_class, BaseEmailClient):
                 raise TypeError(f"Client class must implement BaseEmailClient interface")
         except ImportError:
             self.logger.warning("BaseEmailClient not available for validation")
         
         self._available_providers[name.lower()] = client_class
-        self.logger.info(f"Registered email provider: {name}")
+        self.logger.info("Registered email provider: %s", name)
     
     def get_supported_providers(self) -> List[str]:
         """
@@ -142,7 +306,7 @@ class EmailAccountManager:
         Returns:
             List of supported provider names
         """
-        return list(self._available_providers.keys())
+        return list(dict.fromkeys([*self._available_providers, *self._provider_factories]))
     
     def create_email_client(self, account_name: str):
         """
@@ -157,6 +321,19 @@ class EmailAccountManager:
         Raises:
             ValueError: If account is not configured, disabled, or provider not supported
         """
+        client = self._email_clients.get(account_name)
+        if client is not None:
+            return client
+        with self._account_client_lock(account_name):
+            return self._create_email_client_locked(account_name)
+    
+    def _account_client_lock(self, account_name: str) -> threading.Lock:
+        """Return the lock serializing client creation for one account."""
+        with self._client_lock:
+            return self._client_locks.setdefault(account_name, threading.Lock())
+    
+    def _create_email_client_locked(self, account_name: str, **client_kwargs):
+        """Create the client for create_email_client; the caller holds the account's lock."""
         if account_name in self._email_clients:
             return self._email_clients[account_name]
         
@@ -169,19 +346,18 @@ class EmailAccountManager:
             raise ValueError(f"Email account '{account_name}' is disabled")
         
         provider = account_config.provider.lower()
-        if provider not in self._available_providers:
-            available = ', '.join(self._available_providers.keys())
+        client_class = self._resolve_provider(provider)
+        if client_class is None:
+            available = ', '.join(self.get_supported_providers())
             raise ValueError(f"Unsupported email provider: {provider}. Available: {available}")
         
-        client_class = self._available_providers[provider]
-        
         # Create client with simplified email configuration
         email_config = self._create_email_config(account_config)
-        client = client_class(config=email_config)
+        client = client_class(config=email_config, **client_kwargs)
         
         # Cache the client
         self._email_clients[account_name] = client
-        self.logger.info(f"Created email client for account '{account_name}' ({provider})")
+        self.logger.info("Created email client for account '%s' (%s)", account_name, provider)
         
         return client
     
@@ -203,6 +379,42 @@ class EmailAccountManager:
         
         return self._email_clients[account_name]
     
+    def warm_up_clients(self) -> Future:
+        """
+        Create clients for enabled Gmail accounts on a background thread.
+        
+        Building a Gmail client refreshes its OAuth token and builds the API
+        service, which otherwise happens on the first request for the account.
+        Only accounts whose saved token is valid or refreshes without user
+        interaction are warmed: the browser consent flow is never started
+        here. Failures are logged and the client is created again on first use.
+        
+        Returns:
+            Future that resolves once the warm-up has finished
+        """
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="email-warmup")
+        try:
+            return executor.submit(self._warm_up_clients)
+        finally:
+            # Lets the worker exit once the single task is done
+            executor.shutdown(wait=False)
+    
+    def _warm_up_clients(self) -> None:
+        for name in list(self._enabled_names):
+            account_config = self._account_configs.get(name)
+            if account_config is None or account_config.provider.lower() != "gmail":
+                continue
+            token_path = account_config.google_token_path
+            if not token_path or not Path(token_path).exists():
+                continue
+            try:
+                if name in self._email_clients:
+                    continue
+                with self._account_client_lock(name):
+                    self._create_email_client_locked(name, interactive=False)
+            except Exception as e:
+                self.logger.warning("Failed to warm up email client for account '%s': %s", name, e)
+    
     def remove_email_client(self, account_name: str):
         """
         Remove cached email client.
@@ -212,7 +424,7 @@ class EmailAccountManager:
         """
         if account_name in self._email_clients:
             del self._email_clients[account_name]
-            self.logger.info(f"Removed email client for account '{account_name}'")
+            self.logger.info("Removed email client for account '%s'", account_name)
     
     def clear_all_clients(self):
         """Clear all cached email clients."""
@@ -230,13 +442,14 @@ class EmailAccountManager:
             True if successful, False otherwise
         """
         try:
-            self._account_configs = self.create_account_static(self._account_configs, account_config)
+            self.create_account_static(self._account_configs, account_config, self._default_flag_name)
+            self._refresh_account_caches()
             success = self._save_account_configs()
             if success:
-                self.logger.info(f"Added account '{account_config.name}' with auto-save")
+                self.logger.info("Added account '%s' with auto-save", account_config.name)
             return success
         except Exception as e:
-            self.logger.error(f"Failed to add account '{account_config.name}': {e}")
+            self.logger.error("Failed to add account '%s': %s", account_config.name, e)
             return False
     
     def delete_account(self, account_name: str) -> bool:
@@ -251,20 +464,21 @@ class EmailAccountManager:
         """
         try:
             if account_name not in self._account_configs:
-                self.logger.warning(f"Account '{account_name}' not found for deletion")
+                self.logger.warning("Account '%s' not found for deletion", account_name)
                 return False
             
             # Remove client from cache if it exists
             self.remove_email_client(account_name)
             
             # Delete from configurations
-            self._account_configs = self.delete_account_static(self._account_configs, account_name)
+            self.delete_account_static(self._account_configs, account_name)
+            self._refresh_account_caches()
             success = self._save_account_configs()
             if success:
-                self.logger.info(f"Deleted account '{account_name}' with auto-save")
+                self.logger.info("Deleted account '%s' with auto-save", account_name)
             return success
         except Exception as e:
-            self.logger.error(f"Failed to delete account '{account_name}': {e}")
+            self.logger.error("Failed to delete account '%s': %s", account_name, e)
             return False
     
     def update_account(self, account_name: str, updates: Dict[str, Any]) -> bool:
@@ -279,21 +493,30 @@ class EmailAccountManager:
             True if successful, False otherwise
         """
         try:
-            if account_name not in self._account_configs:
-                self.logger.warning(f"Account '{account_name}' not found for update")
+            current = self._account_configs.get(account_name)
+            if current is None:
+                self.logger.warning("Account '%s' not found for update", account_name)
                 return False
             
-            # Remove client from cache since config is changing
-            self.remove_email_client(account_name)
+            # Enabling an enabled account or re-setting the default changes nothing;
+            # skip the client eviction, cache rebuild and serialization entirely
+            if all(getattr(current, field, _MISSING) == value for field, value in updates.items()):
+                self.logger.debug("Account '%s' already up to date", account_name)
+                return True
+            
+            # Remove client from cache only if a field it depends on is changing
+            if not self._CLIENT_AFFECTING_FIELDS.isdisjoint(updates):
+                self.remove_email_client(account_name)
             
             # Update configurations
-            self._account_configs = self.update_account_static(self._account_configs, account_name, updates)
+            self.update_account_static(self._account_configs, account_name, updates, self._default_flag_name)
+            self._refresh_account_caches()
             success = self._save_account_configs()
             if success:
-                self.logger.info(f"Updated account '{account_name}' with auto-save")
+                self.logger.info("Updated account '%s' with auto-save", account_name)
             return success
         except Exception as e:
-            self.logger.error(f"Failed to update account '{account_name}': {e}")
+            self.logger.error("Failed to update account '%s': %s", account_name, e)
             return False
     
     def get_account_config(self, account_name: str) -> Optional[Any]:
@@ -328,7 +551,7 @@ class EmailAccountManager:
             List of account names
         """
         if enabled_only:
-            return [name for name, config in self._account_configs.items() if config.enabled]
+            return list(self._enabled_names)
         else:
             return list(self._account_configs.keys())
     
@@ -339,11 +562,11 @@ class EmailAccountManager:
         Returns:
             Name of default account, or None if not found
         """
-        return self.get_default_account_name_static(self._account_configs)
+        return self._default_account_name
     
     def _create_email_config(self, account_config):
         """
-        Create simplified email configuration for clients.
+        Create simplified email configuration for clients, reusing it until accounts change.
         
         Args:
             account_config: Configuration for the specific account (EmailAccountConfig)
@@ -351,7 +574,11 @@ class EmailAccountManager:
         Returns:
             EmailConfig object with account-specific settings
         """
-        return EmailConfig(account_config, self.config)
+        email_config = self._email_configs.get(account_config.name)
+        if email_config is None:
+            email_config = EmailConfig(account_config, self.config)
+            self._email_configs[account_config.name] = email_config
+        return email_config
 
     @staticmethod
     def load_accounts_from_file(file_path: Path) -> Dict[str, Any]:
@@ -369,108 +596,104 @@ class EmailAccountManager:
             return EmailAccountManager._get_default_accounts()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                accounts_data = json.load(f)
-            
-            # Import here to avoid circular imports
-            from .config import EmailAccountConfig
+            accounts_data = _json_loads(file_path.read_bytes())
             
             loaded_accounts = {}
             for name, data in accounts_data.items():
-                loaded_accounts[name] = EmailAccountConfig(
-                    name=data["name"],
-                    provider=data["provider"],
-                    display_name=data.get("display_name", ""),
-                    google_credentials_path=Path(data["google_credentials_path"]) if data.get("google_credentials_path") else None,
-                    google_token_path=Path(data["google_token_path"]) if data.get("google_token_path") else None,
-                    enabled=data.get("enabled", True),
-                    default_account=data.get("default_account", False)
+                get = data.get
+                credentials_path = get("google_credentials_path")
+                token_path = get("google_token_path")
+                # Names and providers are compared and used as keys throughout; share one copy each
+                loaded_accounts[sys.intern(name)] = EmailAccountConfig(
+                    name=sys.intern(data["name"]),
+                    provider=sys.intern(data["provider"]),
+                    display_name=get("display_name", ""),
+                    google_credentials_path=Path(credentials_path) if credentials_path else None,
+                    google_token_path=Path(token_path) if token_path else None,
+                    enabled=get("enabled", True),
+                    default_account=get("default_account", False)
                 )
             
             return loaded_accounts
             
         except Exception as e:
-            logging.getLogger(__name__).error(f"Failed to load email accounts from {file_path}: {e}")
+            logging.getLogger(__name__).error("Failed to load email accounts from %s: %s", file_path, e)
             # Return default configuration on error
             return EmailAccountManager._get_default_accounts()
     
     @staticmethod
-    def save_accounts_to_file(accounts: Dict[str, Any], file_path: Path) -> bool:
+    def serialize_accounts(accounts: Dict[str, Any]) -> bytes:
+        """
+        Serialize email accounts to the UTF-8 JSON stored on disk.
+        
+        Args:
+            accounts: Dictionary of email account configurations
+            
+        Returns:
+            Encoded JSON document
+        """
+        return _json_dumps_pretty({name: config.to_dict() for name, config in accounts.items()})
+    
+    @staticmethod
+    def save_accounts_to_file(accounts: Dict[str, Any], file_path: Path, blob: Optional[bytes] = None) -> bool:
         """
         Save email accounts to JSON configuration file.
         
         Args:
             accounts: Dictionary of email account configurations
             file_path: Path to save the configuration file
+            blob: Already serialized accounts, to avoid serializing twice
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Ensure directory exists
-            file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Convert to serializable format
-            accounts_data = {}
-            for name, config in accounts.items():
-                accounts_data[name] = {
-                    "name": config.name,
-                    "provider": config.provider,
-                    "display_name": config.display_name,
-                    "google_credentials_path": str(config.google_credentials_path) if config.google_credentials_path else None,
-                    "google_token_path": str(config.google_token_path) if config.google_token_path else None,
-                    "enabled": config.enabled,
-                    "default_account": config.default_account
-                }
+            # Ensure directory exists (no syscall once it has been created)
+            _ensure_directory_once(file_path.parent)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(accounts_data, f, indent=2, ensure_ascii=False)
+            if blob is None:
+                blob = EmailAccountManager.serialize_accounts(accounts)
             
+            _atomic_write(file_path, blob)
             return True
             
         except Exception as e:
-            logging.getLogger(__name__).error(f"Failed to save email accounts to {file_path}: {e}")
+            logging.getLogger(__name__).error("Failed to save email accounts to %s: %s", file_path, e)
             return False
     
     @staticmethod
     def create_account_static(
         accounts: Dict[str, Any], 
-        account_config: Any
-    ) -> Dict[str, Any]:
+        account_config: Any,
+        prev_default: Optional[str] = None
+    ) -> None:
         """
-        Create a new email account configuration.
+        Create a new email account configuration in place.
         
         Args:
             accounts: Current accounts dictionary
             account_config: New account configuration to add
-            
-        Returns:
-            Updated accounts dictionary
+            prev_default: Name of the account currently flagged as default, if known;
+                only that account is touched instead of sweeping every account
         """
         # If this is set as default, remove default from others
         if account_config.default_account:
-            for existing_config in accounts.values():
-                existing_config.default_account = False
+            EmailAccountManager._clear_default_flag(accounts, prev_default)
         
         # Add the new account
         accounts[account_config.name] = account_config
-        
-        return accounts
     
     @staticmethod
     def delete_account_static(
         accounts: Dict[str, Any], 
         account_name: str
-    ) -> Dict[str, Any]:
+    ) -> None:
         """
-        Delete an email account configuration.
+        Delete an email account configuration in place.
         
         Args:
             accounts: Current accounts dictionary
             account_name: Name of account to delete
-            
-        Returns:
-            Updated accounts dictionary
         """
         if account_name in accounts:
             was_default = accounts[account_name].default_account
@@ -480,43 +703,53 @@ class EmailAccountManager:
             if was_default and accounts:
                 first_account = next(iter(accounts.values()))
                 first_account.default_account = True
-        
-        return accounts
     
     @staticmethod
     def update_account_static(
         accounts: Dict[str, Any], 
         account_name: str,
-        updates: Dict[str, Any]
-    ) -> Dict[str, Any]:
+        updates: Dict[str, Any],
+        prev_default: Optional[str] = None
+    ) -> None:
         """
-        Update an existing email account configuration.
+        Update an existing email account configuration in place.
         
         Args:
             accounts: Current accounts dictionary
             account_name: Name of account to update
             updates: Dictionary of fields to update
-            
-        Returns:
-            Updated accounts dictionary
+            prev_default: Name of the account currently flagged as default, if known;
+                only that account is touched instead of sweeping every account
         """
         if account_name not in accounts:
-            return accounts
+            return
         
         config = accounts[account_name]
         
         # Handle default account changes
         if updates.get('default_account', False):
-            # Remove default from all other accounts
-            for other_config in accounts.values():
-                other_config.default_account = False
+            # Remove default from the other account holding it
+            EmailAccountManager._clear_default_flag(accounts, prev_default)
         
         # Update the configuration
         for field, value in updates.items():
             if hasattr(config, field):
                 setattr(config, field, value)
+    
+    @staticmethod
+    def _clear_default_flag(accounts: Dict[str, Any], prev_default: Optional[str]) -> None:
+        """
+        Clear default_account on the previous default, or on every account if unknown.
         
-        return accounts
+        Args:
+            accounts: Current accounts dictionary
+            prev_default: Name of the account currently flagged as default, if known
+        """
+        if prev_default is None:
+            for config in accounts.values():
+                config.default_account = False
+        elif prev_default in accounts:
+            accounts[prev_default].default_account = False
     
     @staticmethod
     def validate_account_config(account_config: Any) -> List[str]:
@@ -561,8 +794,8 @@ class EmailAccountManager:
                 name="default",
                 provider="gmail",
                 display_name="Default Gmail Account",
-                google_credentials_path=Path(__file__).parent / "secrets" / "credentials.json",
-                google_token_path=Path(__file__).parent / "secrets" / "token.json",
+                google_credentials_path=_SECRETS_DIR / "credentials.json",
+                google_token_path=_SECRETS_DIR / "token.json",
                 enabled=True,
                 default_account=True
             )
@@ -580,12 +813,12 @@ class EmailAccountManager:
             Name of default account, or None if not found
         """
         for name, config in accounts.items():
-            if config.default_account and config.enabled:
+            if _is_default(config) and _is_enabled(config):
                 return name
         
         # If no explicit default, return first enabled account
         for name, config in accounts.items():
-            if config.enabled:
+            if _is_enabled(config):
                 return name
         
         return None
@@ -601,7 +834,7 @@ class EmailAccountManager:
         Returns:
             List of enabled account names
         """
-        return [name for name, config in accounts.items() if config.enabled]
+        return [name for name, config in accounts.items() if _is_enabled(config)]
 
 
 # Additional utility functions
@@ -615,6 +848,49 @@ def ensure_directory_exists(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
 
 
+# Directories already created by this process
+_ensured_dirs: set = set()
+
+
+def _ensure_directory_once(path: Path) -> None:
+    """Create a directory the first time it is seen and skip the syscall afterwards."""
+    if path not in _ensured_dirs:
+        ensure_directory_exists(path)
+        _ensured_dirs.add(path)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """
+    Write data to a temporary sibling in one buffered call and swap it into place,
+    so readers never see a partial file.
+    
+    An existing file keeps its permission bits; a new file is created owner-only.
+    """
+    try:
+        mode = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    with tempfile.NamedTemporaryFile(
+        "wb", buffering=65536, dir=path.parent, delete=False
+    ) as tmp:
+        try:
+            tmp.write(data)
+            # Make the data durable before the rename publishes it
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        except BaseException:
+            tmp.close()
+            os.unlink(tmp.name)
+            raise
+    try:
+        if mode is not None:
+            os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        os.unlink(tmp.name)
+        raise
+
+
 def safe_file_operation(operation, *args, **kwargs) -> Any:
     """
     Safely perform a file operation with error handling.
@@ -630,30 +906,124 @@ def safe_file_operation(operation, *args, **kwargs) -> Any:
     try:
         return operation(*args, **kwargs)
     except Exception as e:
-        logging.getLogger(__name__).error(f"File operation failed: {e}")
+        logging.getLogger(__name__).error("File operation failed: %s", e)
+        return None
+
+
+def update_keys(key: str, value: str) -> bool:
+    """
+    change the api keys in the .env file, returns False if the value was already set
+    """
+    return update_keys_bulk({key: value})
+
+
+async def update_keys_async(key: str, value: str) -> bool:
+    """
+    change the api keys in the .env file without blocking the event loop
+    """
+    return await asyncio.to_thread(update_keys, key, value)
+
+
+def update_keys_bulk(pairs: Dict[str, str]) -> bool:
+    """
+    Change several keys in the .env file with a single write.
+
+    The parsed file is cached between calls and only re-read when its stat
+    signature changes, so repeated updates skip the read pass. The new
+    content goes to a temporary sibling which then atomically replaces the
+    original, so a crash mid-write never leaves a truncated .env behind.
+    Keys that are not present yet are appended. When every key already
+    holds its new value the file is left untouched.
+
+    Args:
+        pairs: Mapping of key names to their new values
+
+    Returns:
+        True if the file was rewritten, False if nothing changed
+    """
+    global _env_cache
+    if not pairs:
+        return False
+
+    env_path = _ENV_PATH
+    with _env_lock:
+        lines, index = _load_env_lines(env_path)
+        changed = False
+        try:
+            for k, v in pairs.items():
+                new_line = f"{k}={v}\n"
+                i = index.get(k)
+                if i is not None:
+                    if lines[i].rstrip("\r\n") != new_line[:-1]:
+                        lines[i] = new_line
+                        changed = True
+                    continue
+                # Keys not found, append to end, ensuring newline
+                if lines and not lines[-1].endswith('\n'):
+                    lines[-1] += '\n'
+                index[k] = len(lines)
+                lines.append(new_line)
+                changed = True
+            if not changed:
+                return False
+            _atomic_write(env_path, "".join(lines).encode("utf-8"))
+        except BaseException:
+            # The cached lines may be half-updated; parse the file again next time
+            _env_cache = None
+            raise
+        _env_cache = (_env_signature(env_path), lines, index)
+        return True
+
+
+def read_env_values() -> Dict[str, Optional[str]]:
+    """
+    Parse the .env file into a dict, reusing the cached file contents.
+
+    Right after update_keys the cache already holds the written lines, so
+    this does not read the file again. The parse itself is dotenv's, so
+    quoting and comments are handled exactly as at startup.
+    """
+    with _env_lock:
+        lines, _ = _load_env_lines(_ENV_PATH)
+        content = "".join(lines)
+    return dotenv_values(stream=io.StringIO(content))
+
+
+# Parsed .env reused across updates: (stat signature, lines, KEY -> first line index)
+_env_lock = threading.Lock()
+_env_cache: Optional[Tuple[Tuple[Any, ...], List[str], Dict[str, int]]] = None
+
+
+def _env_signature(env_path: Path) -> Optional[Tuple[Any, ...]]:
+    """Identify the current version of the .env file, or None if it does not exist."""
+    try:
+        st = env_path.stat()
+    except FileNotFoundError:
         return None
+    return (env_path, st.st_ino, st.st_mtime_ns, st.st_size)
 
 
-def update_keys(key: str, value: str):
+def _load_env_lines(env_path: Path) -> Tuple[List[str], Dict[str, int]]:
     """
-    change the api keys in the .env file
+    Return the .env lines and a map of each key to its first line index.
+
+    The cached parse is returned as long as the file has not changed on disk.
     """
-    env_path = Path(__file__).resolve().parent / ".env"
-    if not env_path.exists():
-        with open(env_path, "w", encoding="utf-8") as f:
-            f.write(f"{key}={value}\n")
-        return
+    global _env_cache
+    signature = _env_signature(env_path)
+    if signature is None:
+        _env_cache = None
+        return [], {}
+    if _env_cache is not None and _env_cache[0] == signature:
+        return _env_cache[1], _env_cache[2]
 
-    with open(env_path, "r+", encoding="utf-8") as f:
+    with open(env_path, "r", encoding="utf-8") as f:
         lines = f.readlines()
-        for idx, line in enumerate(lines):
-            if line.startswith(f"{key}="):
-                lines[idx] = f"{key}={value}\n"
-                f.seek(0)
-                f.writelines(lines)
-                f.truncate()
-                return
-        # Key not found, append to end, ensuring newline
-        if lines and not lines[-1].endswith('\n'):
-            f.write('\n')
-        f.write(f"{key}={value}\n")
+    index: Dict[str, int] = {}
+    for i, line in enumerate(lines):
+        sep = line.find("=")
+        if sep > 0:
+            # Only the first occurrence of a key is replaced
+            index.setdefault(line[:sep], i)
+    _env_cache = (signature, lines, index)
+    return lines, index
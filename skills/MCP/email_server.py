@@ -1,59 +1,54 @@
 from fastmcp import FastMCP
+from contextlib import asynccontextmanager
 from typing import Union, Dict, Any, Optional, List
 import sys
 import os
 
-# Add the project root directory to sys.path so we can import from app
+# Add the project root (for app) and the skills directory (for the skill modules) to sys.path
 # Go up two levels: MCP -> skills -> project root
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+skills_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+project_root = os.path.dirname(skills_dir)
+for path in (project_root, skills_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 # Import config and configure MCP-specific logging
-from app.config import Config
-config = Config()
+from app.config import get_config
+from tool_serialization import mcp_tool_serializer
+config = get_config()
 config.configure_mcp_logging()
 
-try:
-    from skills.email_skills import (
-        get_unread_emails,
-        get_all_unread_emails,
-        send_email,
-        count_unread_emails,
-        count_all_unread_emails,
-        get_email_accounts,
-        mark_emails_as_read,
-        mark_emails_as_unread,
-        delete_email,
-        create_draft,
-        update_draft,
-        send_draft,
-        list_drafts,
-        get_draft,
-        delete_draft
-    )
-except ImportError:
-    # If running directly, try importing from parent skills directory
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from email_skills import (
-        get_unread_emails,
-        get_all_unread_emails,
-        send_email,
-        count_unread_emails,
-        count_all_unread_emails,
-        get_email_accounts,
-        mark_emails_as_read,
-        mark_emails_as_unread,
-        delete_email,
-        create_draft,
-        update_draft,
-        send_draft,
-        list_drafts,
-        get_draft,
-        delete_draft
-    )
-
-mcp = FastMCP("JARVERT-EMAIL")
+# Skill modules are imported directly rather than through the skills package,
+# whose __init__ would also load the combined server and every other skill
+from email_skills import (
+    get_unread_emails,
+    get_all_unread_emails,
+    send_email,
+    count_unread_emails,
+    count_all_unread_emails,
+    get_email_accounts,
+    mark_emails_as_read,
+    mark_emails_as_unread,
+    delete_email,
+    create_draft,
+    update_draft,
+    send_draft,
+    list_drafts,
+    get_draft,
+    delete_draft,
+    get_email_accounts_cached,
+    count_all_unread_emails_cached,
+    normalize_recipients
+)
+
+@asynccontextmanager
+async def lifespan(server):
+    # Authenticate email accounts off the request path
+    from app import email_manager
+    email_manager.warm_up_clients()
+    yield
+
+mcp = FastMCP("JARVERT-EMAIL", lifespan=lifespan, tool_serializer=mcp_tool_serializer)
 
 # ========================================
 # MCP RESOURCES - Fast, Common Features
@@ -66,27 +61,29 @@ def list_email_accounts_resource() -> str:
     This is set as a resource for fast access to account information.
     """
     try:
-        account_info = get_email_accounts()
+        account_info = get_email_accounts_cached()
         if account_info.get('success'):
             # Pretty format the account information
             summary = account_info.get('summary', {})
             accounts = account_info.get('accounts', {})
             
-            result = f"Email Accounts Summary:\n"
-            result += f"Total Accounts: {summary.get('total_accounts', 0)}\n"
-            result += f"Default Account: {summary.get('default_account', 'None')}\n\n"
+            parts = [
+                "Email Accounts Summary:\n",
+                f"Total Accounts: {summary.get('total_accounts', 0)}\n",
+                f"Default Account: {summary.get('default_account', 'None')}\n\n",
+            ]
             
             for account_name, details in accounts.items():
-                result += f"Account: {account_name}\n"
-                result += f"  Provider: {details.get('provider', 'Unknown')}\n"
-                result += f"  Display Name: {details.get('display_name', '')}\n"
-                result += f"  Enabled: {details.get('enabled', False)}\n"
-                result += f"  Is Default: {details.get('is_default', False)}\n"
+                parts.append(f"Account: {account_name}\n")
+                parts.append(f"  Provider: {details.get('provider', 'Unknown')}\n")
+                parts.append(f"  Display Name: {details.get('display_name', '')}\n")
+                parts.append(f"  Enabled: {details.get('enabled', False)}\n")
+                parts.append(f"  Is Default: {details.get('is_default', False)}\n")
                 if 'error' in details:
-                    result += f"  Error: {details['error']}\n"
-                result += "\n"
+                    parts.append(f"  Error: {details['error']}\n")
+                parts.append("\n")
             
-            return result
+            return "".join(parts)
         else:
             return f"Error getting email accounts: {account_info.get('error', 'Unknown error')}"
     except Exception as e:
@@ -94,27 +91,27 @@ def list_email_accounts_resource() -> str:
 
 
 @mcp.resource("mcp://friday/unread-email-counts")
-def unread_email_counts_resource() -> str:
+async def unread_email_counts_resource() -> str:
     """
     Resource providing quick access to unread email counts across all accounts.
     This is set as a resource for fast access to common email status information.
     """
     try:
-        counts = count_all_unread_emails()
+        counts = await count_all_unread_emails_cached()
         if counts.get('success'):
-            result = "Unread Email Counts:\n\n"
+            parts = ["Unread Email Counts:\n\n"]
             
             for account, count_data in counts.get('accounts', {}).items():
                 if isinstance(count_data, dict):
                     count = count_data.get('count', 0)
-                    result += f"{account}: {count} unread emails\n"
+                    parts.append(f"{account}: {count} unread emails\n")
                 else:
-                    result += f"{account}: {count_data} unread emails\n"
+                    parts.append(f"{account}: {count_data} unread emails\n")
             
             total = counts.get('total_count', 0)
-            result += f"\nTotal: {total} unread emails across all accounts"
+            parts.append(f"\nTotal: {total} unread emails across all accounts")
             
-            return result
+            return "".join(parts)
         else:
             return f"Error getting unread counts: {counts.get('error', 'Unknown error')}"
     except Exception as e:
@@ -184,10 +181,7 @@ async def send_email_from_account(
         success: A dictionary with send result and account information
         failure: A dictionary with error information
     """
-    # Convert single strings to lists for the function
-    to_list = [to] if isinstance(to, str) else to
-    cc_list = [cc] if isinstance(cc, str) and cc else None
-    bcc_list = [bcc] if isinstance(bcc, str) and bcc else None
+    to_list, cc_list, bcc_list = normalize_recipients(to), normalize_recipients(cc), normalize_recipients(bcc)
     
     return await send_email(
         to=to_list,
@@ -302,10 +296,7 @@ async def create_draft_tool(
         success: A dictionary with draft creation result and account information
         failure: A dictionary with error information
     """
-    # Convert single strings to lists for the function
-    to_list = [to] if isinstance(to, str) else to
-    cc_list = [cc] if isinstance(cc, str) and cc else None
-    bcc_list = [bcc] if isinstance(bcc, str) and bcc else None
+    to_list, cc_list, bcc_list = normalize_recipients(to), normalize_recipients(cc), normalize_recipients(bcc)
     
     return await create_draft(
         to=to_list,
@@ -345,10 +336,7 @@ async def update_draft_tool(
         success: A dictionary with update result and account information
         failure: A dictionary with error information
     """
-    # Convert single strings to lists for the function
-    to_list = [to] if isinstance(to, str) else to
-    cc_list = [cc] if isinstance(cc, str) and cc else None
-    bcc_list = [bcc] if isinstance(bcc, str) and bcc else None
+    to_list, cc_list, bcc_list = normalize_recipients(to), normalize_recipients(cc), normalize_recipients(bcc)
     
     return await update_draft(
         draft_id=draft_id,
@@ -3,35 +3,30 @@ from typing import Dict, Any
 import sys
 import os
 
-# Add the project root directory to sys.path so we can import from app
+# Add the project root (for app) and the skills directory (for the skill modules) to sys.path
 # Go up two levels: MCP -> skills -> project root
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+skills_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+project_root = os.path.dirname(skills_dir)
+for path in (project_root, skills_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 # Import config and configure MCP-specific logging
-from app.config import Config
-config = Config()
+from app.config import get_config
+from tool_serialization import mcp_tool_serializer
+config = get_config()
 config.configure_mcp_logging()
 
-try:
-    from skills.calendar_skills import (
-        get_upcoming_events    
-    )
-    from skills.drive_skills import (
-        list_drive_files
-    )
-except ImportError:
-    # If running directly, try importing from parent skills directory
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from calendar_skills import (
-        get_upcoming_events
-    )
-    from drive_skills import (
-        list_drive_files
-    )
-
-mcp = FastMCP("JARVERT-GOOGLE")
+# Skill modules are imported directly rather than through the skills package,
+# whose __init__ would also load the combined server and every other skill
+from calendar_skills import (
+    get_upcoming_events
+)
+from drive_skills import (
+    list_drive_files
+)
+
+mcp = FastMCP("JARVERT-GOOGLE", tool_serializer=mcp_tool_serializer)
 
 # ========================================
 # GOOGLE SERVICES TOOLS
@@ -61,7 +61,9 @@ SERVERS = {
         "tools": [
             "list_contacts",
             "add_contact",
+            "add_contacts",
             "update_contact",
+            "update_contacts",
             "delete_contact",
             "find_contact",
             "get_contact_by_id"
@@ -0,0 +1,24 @@
+"""
+Tool result serialization shared by the MCP servers.
+
+Passed to FastMCP(tool_serializer=...) by every server; None lets FastMCP
+fall back to its default serializer when orjson is not installed.
+"""
+
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+
+    def _jsonable(obj: Any) -> Any:
+        # Types orjson does not know (pydantic models, Paths, sets) get FastMCP's own conversion
+        from pydantic_core import to_jsonable_python
+        return to_jsonable_python(obj, fallback=str)
+
+    def _serialize_tool_result(data: Any) -> str:
+        return orjson.dumps(data, default=_jsonable, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    # Tool results such as page HTML can be megabytes; orjson encodes them far faster
+    mcp_tool_serializer: Optional[Callable[[Any], str]] = _serialize_tool_result
+except ImportError:
+    mcp_tool_serializer = None
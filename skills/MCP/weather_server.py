@@ -1,36 +1,40 @@
 from fastmcp import FastMCP
+from contextlib import asynccontextmanager
 from typing import Optional, Dict, Any
 import sys
 import os
 
-# Add the project root directory to sys.path so we can import from app
+# Add the project root (for app) and the skills directory (for the skill modules) to sys.path
 # Go up two levels: MCP -> skills -> project root
-project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+skills_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+project_root = os.path.dirname(skills_dir)
+for path in (project_root, skills_dir):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 # Import config and configure MCP-specific logging
-from app.config import Config
-config = Config()
+from app.config import get_config
+from tool_serialization import mcp_tool_serializer
+config = get_config()
 config.configure_mcp_logging()
 
-try:
-    # Import from specific skill modules for better organization
-    from skills.weather_skills import (
-        get_weather_now as _get_weather_now,
-        get_weather_forecast as _get_weather_forecast,
-        get_weather_at as _get_weather_at
-    )
-except ImportError:
-    # If running directly, try importing from parent skills directory
-    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from weather_skills import (
-        get_weather_now as _get_weather_now,
-        get_weather_forecast as _get_weather_forecast,
-        get_weather_at as _get_weather_at
-    )
-
-mcp = FastMCP("JARVERT-WEATHER")
+# Skill modules are imported directly rather than through the skills package,
+# whose __init__ would also load the combined server and every other skill
+from weather_skills import (
+    get_weather_now as _get_weather_now,
+    get_weather_forecast as _get_weather_forecast,
+    validate_forecast_days as _validate_forecast_days,
+    get_weather_at as _get_weather_at
+)
+
+@asynccontextmanager
+async def lifespan(server):
+    yield
+    # Close the process-wide HTTP session used by the weather tools
+    from app import http_client
+    await http_client.aclose()
+
+mcp = FastMCP("JARVERT-WEATHER", lifespan=lifespan, tool_serializer=mcp_tool_serializer)
 
 # ========================================
 # WEATHER TOOLS
@@ -86,6 +90,9 @@ async def get_weather_forecast(days: int, q: Optional[str] = None) -> Dict[str,
         success: A dictionary contain information key-pair
         failure: A dictionary has key "error" and error information
     """
+    error = _validate_forecast_days(days)
+    if error is not None:
+        return error
     return await _get_weather_forecast(days, q)
 
 @mcp.tool()
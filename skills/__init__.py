@@ -30,6 +30,7 @@ from .email_skills import (
         send_email,
         count_unread_emails,
         count_all_unread_emails,
+        count_all_unread_emails_async,
         get_email_accounts,
         mark_emails_as_read,
         mark_emails_as_unread,
@@ -60,6 +61,7 @@ __all__ = [
     'send_email',
     'count_unread_emails',
     'count_all_unread_emails',
+    'count_all_unread_emails_async',
     'get_email_accounts',
     'mark_emails_as_read',
     'mark_emails_as_unread',
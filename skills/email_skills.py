@@ -7,7 +7,47 @@ and work with any configured email accounts.
 """
 
 from app import email_manager
-from typing import Optional, Union, Dict, Any, List
+from typing import Callable, Optional, Union, Dict, Any, List
+import functools
+import inspect
+import time
+
+
+def _cached_for(ttl: float):
+    """Cache the result of a no-argument function, sync or async, for ttl seconds."""
+    def decorator(fn: Callable[[], Any]) -> Callable[[], Any]:
+        entry = None  # (expires_at, result)
+
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper() -> Dict[str, Any]:
+                nonlocal entry
+                now = time.monotonic()
+                if entry is not None and entry[0] > now:
+                    return entry[1]
+                result = await fn()
+                entry = (now + ttl, result)
+                return result
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper() -> Dict[str, Any]:
+            nonlocal entry
+            now = time.monotonic()
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            result = fn()
+            entry = (now + ttl, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def normalize_recipients(recipients: Union[str, List[str], None]) -> Optional[List[str]]:
+    """Turn a single address or a list of addresses into a list; empty input gives None."""
+    if not recipients:
+        return None
+    return [recipients] if isinstance(recipients, str) else list(recipients)
 
 
 async def get_unread_emails(
@@ -139,6 +179,31 @@ def count_all_unread_emails() -> Dict[str, Any]:
     return email_manager.count_all_unread_messages()
 
 
+async def count_all_unread_emails_async() -> Dict[str, Any]:
+    """
+    Count unread emails across all configured accounts without blocking the event loop.
+    
+    Accounts are queried concurrently, each bounded by the configured timeout.
+    
+    Returns:
+        Dict with success status, per-account counts and the total
+    """
+    try:
+        counts = await email_manager.count_all_unread_messages_async()
+        return {
+            'success': True,
+            'accounts': counts,
+            'total_count': sum(c.get('count', 0) for c in counts.values()),
+            'service': 'EmailManager'
+        }
+    except Exception as e:
+        return {
+            'success': False,
+            'error': str(e),
+            'service': 'EmailManager'
+        }
+
+
 def get_email_accounts() -> Dict[str, Any]:
     """
     Get information about all configured email accounts.
@@ -364,3 +429,9 @@ def delete_draft(
         Dict with deletion result and account information
     """
     return email_manager.delete_draft(draft_id, account)
+
+
+# Short-lived snapshots for the MCP resources, which clients may poll;
+# account configuration rarely changes, unread counts should stay fresh
+get_email_accounts_cached = _cached_for(10.0)(get_email_accounts)
+count_all_unread_emails_cached = _cached_for(3.0)(count_all_unread_emails_async)
@@ -1,4 +1,6 @@
 from fastmcp import FastMCP
+from pydantic import ValidationError
+from contextlib import asynccontextmanager
 from typing import Union, Tuple, Dict, Any, Optional, List
 import sys
 import os
@@ -9,9 +11,10 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 
 # Import config and configure MCP-specific logging
-from app.config import Config
-from app import ContactBooklet
-config = Config()
+from app.config import get_config
+from app import ContactBooklet, http_client, email_manager
+from app.modules.contact_booklet import parse_contact, parse_contacts
+config = get_config()
 config.configure_mcp_logging()
 
 try:
@@ -19,6 +22,7 @@ try:
     from skills.weather_skills import (
         get_weather_now as _get_weather_now,
         get_weather_forecast as _get_weather_forecast,
+        validate_forecast_days as _validate_forecast_days,
         get_weather_at as _get_weather_at
     )
     from skills.email_skills import (
@@ -36,7 +40,10 @@ try:
         send_draft,
         list_drafts,
         get_draft,
-        delete_draft
+        delete_draft,
+        get_email_accounts_cached,
+        count_all_unread_emails_cached,
+        normalize_recipients
     )
     from skills.calendar_skills import (
         get_upcoming_events    )
@@ -73,11 +80,13 @@ try:
         create_new_browser_session,
         get_browser_session_status
     )
+    from skills.MCP.tool_serialization import mcp_tool_serializer
 except ImportError:
     # If running directly, try importing from current directory
     from weather_skills import (
         get_weather_now as _get_weather_now,
         get_weather_forecast as _get_weather_forecast,
+        validate_forecast_days as _validate_forecast_days,
         get_weather_at as _get_weather_at
     )
     from email_skills import (
@@ -95,7 +104,11 @@ except ImportError:
         send_draft,
         list_drafts,
         get_draft,
-        delete_draft    )
+        delete_draft,
+        get_email_accounts_cached,
+        count_all_unread_emails_cached,
+        normalize_recipients
+    )
     from calendar_skills import (
         get_upcoming_events
     )
@@ -131,8 +144,17 @@ except ImportError:
         create_new_browser_session,
         get_browser_session_status
     )
+    from MCP.tool_serialization import mcp_tool_serializer
+
+@asynccontextmanager
+async def lifespan(server):
+    # Authenticate email accounts off the request path
+    email_manager.warm_up_clients()
+    yield
+    # Close the process-wide HTTP session used by the weather tools
+    await http_client.aclose()
 
-mcp = FastMCP("ITS-FRIDAY")
+mcp = FastMCP("ITS-FRIDAY", lifespan=lifespan, tool_serializer=mcp_tool_serializer)
 
 # ========================================
 # MCP RESOURCES - Fast, Common Features
@@ -145,27 +167,29 @@ def list_email_accounts_resource() -> str:
     This is set as a resource for fast access to account information.
     """
     try:
-        account_info = get_email_accounts()
+        account_info = get_email_accounts_cached()
         if account_info.get('success'):
             # Pretty format the account information
             summary = account_info.get('summary', {})
             accounts = account_info.get('accounts', {})
             
-            result = f"Email Accounts Summary:\n"
-            result += f"Total Accounts: {summary.get('total_accounts', 0)}\n"
-            result += f"Default Account: {summary.get('default_account', 'None')}\n\n"
+            parts = [
+                "Email Accounts Summary:\n",
+                f"Total Accounts: {summary.get('total_accounts', 0)}\n",
+                f"Default Account: {summary.get('default_account', 'None')}\n\n",
+            ]
             
             for account_name, details in accounts.items():
-                result += f"Account: {account_name}\n"
-                result += f"  Provider: {details.get('provider', 'Unknown')}\n"
-                result += f"  Display Name: {details.get('display_name', '')}\n"
-                result += f"  Enabled: {details.get('enabled', False)}\n"
-                result += f"  Is Default: {details.get('is_default', False)}\n"
+                parts.append(f"Account: {account_name}\n")
+                parts.append(f"  Provider: {details.get('provider', 'Unknown')}\n")
+                parts.append(f"  Display Name: {details.get('display_name', '')}\n")
+                parts.append(f"  Enabled: {details.get('enabled', False)}\n")
+                parts.append(f"  Is Default: {details.get('is_default', False)}\n")
                 if 'error' in details:
-                    result += f"  Error: {details['error']}\n"
-                result += "\n"
+                    parts.append(f"  Error: {details['error']}\n")
+                parts.append("\n")
             
-            return result
+            return "".join(parts)
         else:
             return f"Error getting email accounts: {account_info.get('error', 'Unknown error')}"
     except Exception as e:
@@ -173,27 +197,27 @@ def list_email_accounts_resource() -> str:
 
 
 @mcp.resource("mcp://friday/unread-email-counts")
-def unread_email_counts_resource() -> str:
+async def unread_email_counts_resource() -> str:
     """
     Resource providing quick access to unread email counts across all accounts.
     This is set as a resource for fast access to common email status information.
     """
     try:
-        counts = count_all_unread_emails()
+        counts = await count_all_unread_emails_cached()
         if counts.get('success'):
-            result = "Unread Email Counts:\n\n"
+            parts = ["Unread Email Counts:\n\n"]
             
             for account, count_data in counts.get('accounts', {}).items():
                 if isinstance(count_data, dict):
                     count = count_data.get('count', 0)
-                    result += f"{account}: {count} unread emails\n"
+                    parts.append(f"{account}: {count} unread emails\n")
                 else:
-                    result += f"{account}: {count_data} unread emails\n"
+                    parts.append(f"{account}: {count_data} unread emails\n")
             
             total = counts.get('total_count', 0)
-            result += f"\nTotal: {total} unread emails across all accounts"
+            parts.append(f"\nTotal: {total} unread emails across all accounts")
             
-            return result
+            return "".join(parts)
         else:
             return f"Error getting unread counts: {counts.get('error', 'Unknown error')}"
     except Exception as e:
@@ -254,6 +278,9 @@ async def get_weather_forecast(days: int, q: Optional[str] = None) -> Dict[str,
         success: A dictionary contain information key-pair
         failure: A dictionary has key "error" and error information
     """
+    error = _validate_forecast_days(days)
+    if error is not None:
+        return error
     return await _get_weather_forecast(days, q)
 
 @mcp.tool()
@@ -341,10 +368,7 @@ async def send_email_from_account(
         success: A dictionary with send result and account information
         failure: A dictionary with error information
     """
-    # Convert single strings to lists for the function
-    to_list = [to] if isinstance(to, str) else to
-    cc_list = [cc] if isinstance(cc, str) and cc else None
-    bcc_list = [bcc] if isinstance(bcc, str) and bcc else None
+    to_list, cc_list, bcc_list = normalize_recipients(to), normalize_recipients(cc), normalize_recipients(bcc)
     
     return await send_email(
         to=to_list,
@@ -459,10 +483,7 @@ async def create_draft_tool(
         success: A dictionary with draft creation result and account information
         failure: A dictionary with error information
     """
-    # Convert single strings to lists for the function
-    to_list = [to] if isinstance(to, str) else to
-    cc_list = [cc] if isinstance(cc, str) and cc else None
-    bcc_list = [bcc] if isinstance(bcc, str) and bcc else None
+    to_list, cc_list, bcc_list = normalize_recipients(to), normalize_recipients(cc), normalize_recipients(bcc)
     
     return await create_draft(
         to=to_list,
@@ -502,10 +523,7 @@ async def update_draft_tool(
         success: A dictionary with update result and account information
         failure: A dictionary with error information
     """
-    # Convert single strings to lists for the function
-    to_list = [to] if isinstance(to, str) else to
-    cc_list = [cc] if isinstance(cc, str) and cc else None
-    bcc_list = [bcc] if isinstance(bcc, str) and bcc else None
+    to_list, cc_list, bcc_list = normalize_recipients(to), normalize_recipients(cc), normalize_recipients(bcc)
     
     return await update_draft(
         draft_id=draft_id,
@@ -591,21 +609,27 @@ def delete_draft_tool(
 # ========================================
 
 @mcp.tool()
-def list_contacts(offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
+def list_contacts(offset: int = 0, limit: int = 20, cursor: Optional[int] = None) -> Dict[str, Any]:
     """
     List all contacts with pagination support.
     
     This tool retrieves contacts from the contact database with support for pagination.
     Use this when you need to browse through all contacts or get a general overview.
+    Contacts are returned in ID order.
     
     Args:
         offset (int, optional): Number of records to skip for pagination. Defaults to 0.
-                               Use this to implement pagination (e.g., offset=0 for page 1, 
-                               offset=20 for page 2 if limit=20).
+                               Deprecated: prefer cursor, which stays fast on deep pages.
+                               Ignored when cursor is given.
         limit (int, optional): Maximum number of records to return. Defaults to 20.
                               Controls the page size. Maximum recommended value is 100.
+        cursor (int, optional): The next_cursor value from the previous page. Omit it
+                               for the first page.
       Returns:
-        List[Dict[str, Any]]: List of contact dictionaries, each containing:
+        Dict[str, Any]: Dictionary containing:
+          - next_cursor (int or None): Pass as cursor to get the next page; None on the last page
+          - has_more (bool): Whether another page may follow (next_cursor is not None)
+          - contacts: List of contact dictionaries, each containing:
             - id (int): Unique database ID of the contact
             - surname (str): Last name of the contact
             - forename (str): First name of the contact  
@@ -618,17 +642,25 @@ def list_contacts(offset: int = 0, limit: int = 20) -> List[Dict[str, Any]]:
     
     Example Usage:
         # Get first 20 contacts
-        contacts = list_contacts()
+        page = list_contacts()
         
-        # Get contacts 21-40 (page 2)
-        contacts = list_contacts(offset=20, limit=20)
+        # Get the next 20 contacts (page 2)
+        page = list_contacts(cursor=page["next_cursor"], limit=20)
         
         # Get just 5 contacts
-        contacts = list_contacts(limit=5)
+        page = list_contacts(limit=5)
     """
-    result = ContactBooklet.load_contacts(offset=offset, limit=limit)
+    if limit < 1:
+        return {'error': 'limit must be at least 1', 'manager': 'ContactBooklet'}
+    
+    result = ContactBooklet.load_contacts(offset=offset, limit=limit, cursor=cursor)
     if result.get('success'):
-        return [c.__dict__ for c in result.get('contacts', [])]
+        next_cursor = result.get('next_cursor')
+        return {
+            'contacts': [c.to_dict() for c in result.get('contacts', [])],
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None
+        }
     else:
         return {'error': result.get('error', 'Unknown error'), 'manager': result.get('manager', 'ContactBooklet')}
 
@@ -682,10 +714,9 @@ def add_contact(contact: Dict[str, Any]) -> Dict[str, Any]:
         })
     """
     try:
-        from app.modules.contact_booklet import Contact
-        c = Contact(**contact)
+        c = parse_contact(contact)
         return ContactBooklet.add_contact(c)
-    except Exception as e:
+    except ValidationError as e:
         return {'success': False, 'error': f'Invalid contact data: {str(e)}', 'manager': 'ContactBooklet'}
 
 @mcp.tool()
@@ -731,58 +762,123 @@ def update_contact(contact_id: int, updated: Dict[str, Any]) -> Dict[str, Any]:
         })
     """
     try:
-        from app.modules.contact_booklet import Contact
-        c = Contact(**updated)
+        c = parse_contact(updated)
         return ContactBooklet.update_contact(contact_id, c)
-    except Exception as e:
+    except ValidationError as e:
         return {'success': False, 'error': f'Invalid contact data: {str(e)}', 'manager': 'ContactBooklet'}
 
 @mcp.tool()
-def delete_contact(name: str) -> Dict[str, Any]:
+def add_contacts(contacts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Add several contacts at once in a single database transaction.
+    
+    Prefer this over repeated add_contact calls when importing many contacts.
+    Every entry is validated first; invalid entries are reported in 'failed'
+    and the valid ones are still added.
+    
+    Args:
+        contacts (List[Dict[str, Any]]): Contact dictionaries with the same fields as add_contact
+    
+    Returns:
+        Dict[str, Any]: Result dictionary containing:
+            - success (bool): Whether the operation succeeded
+            - contact_ids (List[int]): IDs of the new contacts, in input order of the valid entries
+            - failed (List[Dict]): Invalid entries as {'index': int, 'error': str}
+            - error (str): Error message (if unsuccessful)
+            - manager (str): Name of the manager that handled the request
+    
+    Example Usage:
+        result = add_contacts([
+            {"surname": "Doe", "forename": "John"},
+            {"surname": "Smith", "forename": "Jane", "email": "jane.smith@email.com"}
+        ])
+    """
+    valid, failed = parse_contacts(contacts)
+    result = ContactBooklet.add_contacts(valid) if valid else {'success': True, 'contact_ids': []}
+    result['failed'] = failed
+    return result
+
+@mcp.tool()
+def update_contacts(updates: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Update several contacts at once in a single database transaction.
+    
+    Each entry has the same fields as update_contact's 'updated' plus the contact's 'id'.
+    All fields of an entry replace the existing values of that contact.
+    
+    Args:
+        updates (List[Dict[str, Any]]): Contact dictionaries, each including 'id' (int)
+    
+    Returns:
+        Dict[str, Any]: Result dictionary containing:
+            - success (bool): Whether the operation succeeded
+            - updated (List[int]): IDs of the contacts that were updated
+            - not_found (List[int]): IDs that do not exist
+            - failed (List[Dict]): Invalid entries, including repeats of an earlier entry's id,
+              as {'index': int, 'error': str}
+            - error (str): Error message (if unsuccessful)
+            - manager (str): Name of the manager that handled the request
+    
+    Example Usage:
+        result = update_contacts([
+            {"id": 12, "surname": "Doe", "forename": "John", "phone": "+1-555-9999"},
+            {"id": 15, "surname": "Smith", "forename": "Jane", "tags": ["vip"]}
+        ])
+    """
+    valid, failed = parse_contacts(updates, require_id=True)
+    by_id = {c.id: c for c in valid}
+    result = ContactBooklet.update_contacts(by_id) if by_id else {'success': True, 'updated': [], 'not_found': []}
+    result['failed'] = failed
+    return result
+
+@mcp.tool()
+def delete_contact(name: str, prefix: bool = False) -> Dict[str, Any]:
     """
     Delete contacts by name (surname or forename).
     
-    This tool deletes all contacts whose surname or forename contains the specified name.
-    The search is case-insensitive and supports partial matches.
+    This tool deletes all contacts whose surname or forename equals the specified name.
+    The match is case-insensitive. Set prefix=True to also delete contacts whose surname
+    or forename merely starts with the name.
     
     WARNING: This operation cannot be undone. Be specific with the name to avoid 
-    accidentally deleting multiple contacts.
+    accidentally deleting multiple contacts, especially with prefix=True.
     
     Args:
-        name (str): Name to search for deletion. Searches both surname and forename fields.
-                   Case-insensitive partial matching is used.
+        name (str): Name to match for deletion. Checked against both surname and
+                   forename fields, case-insensitively. Must not be empty.
+        prefix (bool, optional): Match names starting with name instead of equal to it.
+                                Defaults to False.
     
     Returns:
         Dict[str, Any]: Result dictionary containing:
             - success (bool): Whether the operation succeeded
             - deleted (int): Number of contacts deleted (if successful)
+            - deleted_ids (List[int]): IDs of the deleted contacts in ascending order (if successful)
             - error (str): Error message (if unsuccessful)
             - manager (str): Name of the manager that handled the request
     
     Example Usage:
-        # Delete all contacts with "John" in surname or forename
+        # Delete all contacts whose surname or forename is "John"
         result = delete_contact("John")
         
-        # Delete contacts with "Doe" in surname or forename
-        result = delete_contact("Doe")
-        
-        # More specific search to avoid accidental deletions
-        result = delete_contact("John Doe")
+        # Delete all contacts whose surname or forename starts with "Johns" (Johnson, Johnston, ...)
+        result = delete_contact("Johns", prefix=True)
     
     Note:
         - Use find_contact first to see what will be deleted
         - Consider using update_contact to modify instead of delete
         - For single contact deletion, use a very specific name
     """
-    return ContactBooklet.delete_contact(name)
+    return ContactBooklet.delete_contact(name, prefix=prefix)
 
 @mcp.tool()
 def find_contact(
     name: str = None, 
     contact_id: int = None, 
     offset: int = 0, 
-    limit: int = 20
-) -> List[Dict[str, Any]]:
+    limit: int = 20,
+    cursor: Optional[int] = None
+) -> Dict[str, Any]:
     """
     Find contacts by name or ID with pagination support.
     
@@ -795,11 +891,15 @@ def find_contact(
                              Case-insensitive partial matching is used.
         contact_id (int, optional): Specific contact ID to find. Returns exact match only.
         offset (int, optional): Number of records to skip for pagination. Defaults to 0.
+                               Deprecated: prefer cursor. Ignored when cursor is given.
         limit (int, optional): Maximum number of records to return. Defaults to 20.
+        cursor (int, optional): The next_cursor value from the previous page of a name search.
       Returns:
-        List[Dict[str, Any]]: List of matching contact dictionaries with same structure as list_contacts.
-                             Returns empty list if no matches found.
-                             Each contact contains:
+        Dict[str, Any]: Dictionary containing:
+          - next_cursor (int or None): Pass as cursor to get the next page; None on the last page
+          - has_more (bool): Whether another page may follow (next_cursor is not None)
+          - contacts: List of matching contact dictionaries with same structure as list_contacts.
+                      Empty if no matches found. Each contact contains:
             - id (int): Unique database ID of the contact
             - surname (str): Last name
             - forename (str): First name
@@ -812,19 +912,19 @@ def find_contact(
     
     Example Usage:
         # Search by name (partial match)
-        contacts = find_contact(name="John")
-        contacts = find_contact(name="Smith")
-        contacts = find_contact(name="john doe")  # Case-insensitive
+        result = find_contact(name="John")
+        result = find_contact(name="Smith")
+        result = find_contact(name="john doe")  # Case-insensitive
         
         # Search by exact ID
-        contacts = find_contact(contact_id=123)
+        result = find_contact(contact_id=123)
         
         # Search with pagination
-        contacts = find_contact(name="John", offset=0, limit=10)
-        contacts = find_contact(name="John", offset=10, limit=10)  # Next page
+        page = find_contact(name="John", limit=10)
+        page = find_contact(name="John", cursor=page["next_cursor"], limit=10)  # Next page
         
         # Get all contacts named "Smith" (no limit)
-        contacts = find_contact(name="Smith", limit=100)
+        result = find_contact(name="Smith", limit=100)
     
     Note:
         - Exactly one of 'name' or 'contact_id' must be provided
@@ -838,9 +938,17 @@ def find_contact(
     if name is not None and contact_id is not None:
         return {'error': 'Provide either name or contact_id, not both', 'manager': 'ContactBooklet'}
     
-    result = ContactBooklet.find_contact(name=name, contact_id=contact_id, offset=offset, limit=limit)
+    if limit < 1:
+        return {'error': 'limit must be at least 1', 'manager': 'ContactBooklet'}
+    
+    result = ContactBooklet.find_contact(name=name, contact_id=contact_id, offset=offset, limit=limit, cursor=cursor)
     if result.get('success'):
-        return [c.__dict__ for c in result.get('contacts', [])]
+        next_cursor = result.get('next_cursor')
+        return {
+            'contacts': [c.to_dict() for c in result.get('contacts', [])],
+            'next_cursor': next_cursor,
+            'has_more': next_cursor is not None
+        }
     else:
         return {'error': result.get('error', 'Unknown error'), 'manager': result.get('manager', 'ContactBooklet')}
 
@@ -869,9 +977,9 @@ def get_contact_by_id(contact_id: int) -> Dict[str, Any]:
         else:
             print(f"Error: {contact['error']}")    
     """
-    result = ContactBooklet.get_contact_by_id(contact_id)
+    result = ContactBooklet.get_contact_by_id_dict(contact_id)
     if result.get('success'):
-        return result.get('contact').__dict__
+        return result.get('contact')
     else:
         return {'error': result.get('error', 'Unknown error'), 'manager': result.get('manager', 'ContactBooklet')}
 
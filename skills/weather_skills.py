@@ -27,6 +27,19 @@ async def get_weather_now(
     return await weather_service.get_weather(q=q, format=format)
 
 
+def validate_forecast_days(days: int) -> Optional[Dict[str, Any]]:
+    """
+    Validate the forecast range synchronously, before any coroutine is created.
+    
+    Args:
+        days: Number of days to forecast (1-14)
+        
+    Returns:
+        None if valid, otherwise a Dict with an "error" key
+    """
+    return weather_service.validate_forecast(days)
+
+
 async def get_weather_forecast(
     days: int,
     q: Optional[str] = None,
@@ -1,9 +1,15 @@
 import unittest
+import tempfile
 import sys, os
+from pathlib import Path
+from unittest.mock import patch
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
 from app.db.database import Base, engine, SessionLocal
 from app.db.models import Contact as ORMContact
-from app.modules.contact_booklet import Contact, ContactManager
+from app.modules import contact_booklet
+from app.modules.contact_booklet import Contact, ContactManager, parse_contacts
 
 class TestContactManager(unittest.TestCase):
     @classmethod
@@ -83,5 +89,171 @@ class TestContactManager(unittest.TestCase):
         contacts = self.manager.load_contacts()
         self.assertEqual(len(contacts), 0)
 
+class TestContactQueries(unittest.TestCase):
+    """Runs ContactManager against a throwaway SQLite file instead of the app database."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.engine = create_engine(f"sqlite:///{Path(self.tmp_dir.name) / 'contacts.db'}", future=True)
+        self.addCleanup(self.engine.dispose)
+        session_factory = sessionmaker(bind=self.engine, autoflush=False, autocommit=False)
+        for name, value in (("engine", self.engine), ("SessionLocal", session_factory)):
+            patcher = patch.object(contact_booklet, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def make_manager(self):
+        manager = ContactManager()
+        self.addCleanup(manager.db.close)
+        return manager
+
+    @staticmethod
+    def person(surname, forename, **fields):
+        return Contact(surname=surname, forename=forename, phone="555-0100", **fields)
+
+    def test_delete_matches_exact_name_unless_prefix(self):
+        manager = self.make_manager()
+        ids = manager.add_contacts([
+            self.person("Johnson", "Ann"),
+            self.person("Doe", "john"),
+            self.person("Johnston", "Bob"),
+        ])['contact_ids']
+
+        result = manager.delete_contact("JOHN")
+        self.assertEqual(result['deleted_ids'], [ids[1]])
+
+        result = manager.delete_contact("johns", prefix=True)
+        self.assertEqual(result['deleted_ids'], sorted([ids[0], ids[2]]))
+        self.assertEqual(manager.load_contacts()['contacts'], [])
+
+        self.assertFalse(manager.delete_contact("  ")['success'])
+
+    def test_add_contacts_returns_ids_in_input_order(self):
+        manager = self.make_manager()
+        result = manager.add_contacts([self.person("Zed", "Amy"), self.person("Abe", "Bea")])
+        self.assertTrue(result['success'])
+        ids = result['contact_ids']
+        self.assertEqual(len(ids), 2)
+        self.assertEqual(manager.get_contact_by_id(ids[0])['contact'].surname, "Zed")
+        self.assertEqual(manager.get_contact_by_id(ids[1])['contact'].surname, "Abe")
+
+    def test_parse_contacts_reports_repeated_ids(self):
+        contacts, failed = parse_contacts([
+            {"id": 1, "surname": "Smith", "forename": "Jane", "phone": "1"},
+            {"id": 2, "surname": "Doe", "forename": "John", "phone": "2"},
+            {"id": 1, "surname": "Smith", "forename": "Janet", "phone": "3"},
+            {"surname": "No", "forename": "Id", "phone": "4"},
+        ], require_id=True)
+        self.assertEqual([(c.id, c.forename) for c in contacts], [(1, "Jane"), (2, "John")])
+        self.assertEqual([f['index'] for f in failed], [2, 3])
+        self.assertIn("index 0", failed[0]['error'])
+
+    def test_update_contacts_skips_unknown_ids(self):
+        manager = self.make_manager()
+        (contact_id,) = manager.add_contacts([self.person("Smith", "Jane")])['contact_ids']
+        missing_id = contact_id + 100
+
+        result = manager.update_contacts({
+            contact_id: self.person("Smith", "Janet", tags=["vip"]),
+            missing_id: self.person("Nobody", "Here"),
+        })
+        self.assertEqual(result['updated'], [contact_id])
+        self.assertEqual(result['not_found'], [missing_id])
+
+        contact = manager.get_contact_by_id(contact_id)['contact']
+        self.assertEqual((contact.forename, contact.tags), ("Janet", ["vip"]))
+        # The casefolded search column follows the update
+        self.assertEqual([c.id for c in manager.find_contact(name="JANET")['contacts']], [contact_id])
+        self.assertFalse(manager.get_contact_by_id(missing_id)['success'])
+
+    def test_name_search_ids_come_from_covering_index(self):
+        manager = self.make_manager()
+        manager.add_contacts([self.person(f"Surname{i}", f"Forename{i}", others={"note": "x" * 200})
+                              for i in range(500)])
+        with self.engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+
+        statements = []
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().startswith("SELECT contacts.id") and "LIKE" in statement:
+                statements.append((statement, parameters))
+        event.listen(self.engine, "before_cursor_execute", capture)
+        self.addCleanup(event.remove, self.engine, "before_cursor_execute", capture)
+
+        first = manager.find_contact(name="name1", limit=5)
+        manager.find_contact(name="name1", limit=5, cursor=first['next_cursor'])
+        manager.find_contact(name="name1", offset=5, limit=5)
+        self.assertEqual(len(statements), 3)
+
+        with self.engine.connect() as conn:
+            for statement, parameters in statements:
+                plan = " | ".join(row[-1] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters))
+                self.assertIn("USING COVERING INDEX ix_contacts_name_lc", plan)
+                self.assertNotIn("PRIMARY KEY", plan)
+
+    def test_cursor_pages_walk_every_contact_once(self):
+        manager = self.make_manager()
+        ids = manager.add_contacts([self.person(f"Name{i}", "Test") for i in range(5)])['contact_ids']
+
+        seen, cursor, pages = [], None, 0
+        while True:
+            page = manager.load_contacts(limit=2, cursor=cursor)
+            self.assertTrue(page['success'])
+            seen.extend(c.id for c in page['contacts'])
+            pages += 1
+            cursor = page['next_cursor']
+            if cursor is None:
+                break
+        self.assertEqual(seen, sorted(ids))
+        self.assertEqual(pages, 3)
+
+        # A full last page yields a cursor whose next page is empty
+        page = manager.load_contacts(limit=5)
+        self.assertEqual(page['next_cursor'], ids[-1])
+        self.assertEqual(manager.load_contacts(limit=5, cursor=ids[-1]), {'success': True, 'contacts': [], 'next_cursor': None})
+
+    def test_non_positive_limit_is_rejected(self):
+        manager = self.make_manager()
+        manager.add_contacts([self.person("Doe", "John")])
+        self.assertFalse(manager.load_contacts(limit=0)['success'])
+        self.assertFalse(manager.find_contact(name="doe", limit=0)['success'])
+
+    def test_redundant_surname_index_is_dropped(self):
+        self.make_manager()
+        with self.engine.begin() as conn:
+            conn.execute(text("CREATE INDEX ix_contacts_surname_lc ON contacts (surname_lc)"))
+
+        self.make_manager()
+
+        indexes = {i['name'] for i in inspect(self.engine).get_indexes('contacts')}
+        self.assertNotIn('ix_contacts_surname_lc', indexes)
+        self.assertIn('ix_contacts_name_lc', indexes)
+
+    def test_old_schema_is_migrated_and_backfilled(self):
+        # A contacts table from before the casefolded name columns existed
+        with self.engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE contacts (id INTEGER PRIMARY KEY, surname VARCHAR NOT NULL, "
+                "forename VARCHAR NOT NULL, other_names TEXT, email VARCHAR, phone VARCHAR NOT NULL, "
+                "address VARCHAR, tags TEXT, others TEXT)"
+            ))
+            conn.execute(text(
+                "INSERT INTO contacts (id, surname, forename, phone) VALUES (1, 'Straße', 'ÉMILE', '555-0100')"
+            ))
+
+        manager = self.make_manager()
+
+        inspector = inspect(self.engine)
+        columns = {c['name'] for c in inspector.get_columns('contacts')}
+        self.assertTrue({'surname_lc', 'forename_lc'} <= columns)
+        indexes = {i['name'] for i in inspector.get_indexes('contacts')}
+        self.assertTrue({'ix_contacts_name_lc', 'ix_contacts_forename_lc'} <= indexes)
+        self.assertNotIn('ix_contacts_surname_lc', indexes)
+        with self.engine.connect() as conn:
+            row = conn.execute(text("SELECT surname_lc, forename_lc FROM contacts WHERE id = 1")).one()
+        self.assertEqual(tuple(row), ('strasse', 'émile'))
+        self.assertEqual([c.id for c in manager.find_contact(name="STRASSE")['contacts']], [1])
+
 if __name__ == "__main__":
     unittest.main()
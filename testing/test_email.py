@@ -37,6 +37,26 @@ except ImportError as e:
     sys.exit(1)
 
 
+class FakeBatch:
+    """Stand-in for a BatchHttpRequest that answers each added request from a dict keyed by message ID."""
+
+    def __init__(self, callback, responses):
+        self.callback = callback
+        self.responses = responses
+        self.request_ids = []
+
+    def add(self, request, request_id=None):
+        self.request_ids.append(request_id)
+
+    def execute(self):
+        for request_id in self.request_ids:
+            response = self.responses[request_id]
+            if isinstance(response, Exception):
+                self.callback(request_id, None, response)
+            else:
+                self.callback(request_id, response, None)
+
+
 class TestGmailClient(unittest.TestCase):
     """Test suite for Gmail Client functionality."""
     
@@ -112,6 +132,19 @@ class TestGmailClient(unittest.TestCase):
         """Helper to encode text as base64 URL-safe."""
         return base64.urlsafe_b64encode(text.encode('utf-8')).decode('utf-8')
 
+    def use_batch(self, responses):
+        """Route batched message fetches to FakeBatch instances; returns the list of batches created."""
+        batches = []
+
+        def new_batch(callback):
+            batch = FakeBatch(callback, responses)
+            batches.append(batch)
+            return batch
+
+        self.mock_service.new_batch_http_request.side_effect = new_batch
+        self.addCleanup(setattr, self.mock_service.new_batch_http_request, 'side_effect', None)
+        return batches
+
     # ========================================
     # MESSAGE RETRIEVAL TESTS
     # ========================================
@@ -136,9 +169,26 @@ class TestGmailClient(unittest.TestCase):
         self.assertEqual(messages[1]['id'], 'msg2')
           # Verify API was called correctly
         self.mock_service.users().messages().list.assert_called_with(
-            userId='me', maxResults=2
+            userId='me', maxResults=2, fields='messages(id,threadId)'
         )
 
+    def test_list_messages_ids_only(self):
+        """Test that search and unread listing request only message IDs."""
+        self.mock_service.users().messages().list().execute.return_value = {'messages': [{'id': 'msg1'}]}
+        self.use_batch({'msg1': self.create_mock_message('msg1')})
+        
+        messages = self.client.list_messages(max_results=3, fields="messages/id")
+        self.assertEqual(messages, [{'id': 'msg1'}])
+        self.mock_service.users().messages().list.assert_called_with(
+            userId='me', maxResults=3, fields='messages/id'
+        )
+        
+        self.client.search_messages("from:sender1@example.com")
+        self.assertEqual(self.mock_service.users().messages().list.call_args[1]['fields'], 'messages/id')
+        
+        self.client.list_unread(max_results=5)
+        self.assertEqual(self.mock_service.users().messages().list.call_args[1]['fields'], 'messages/id')
+
     def test_list_messages_with_query(self):
         """Test message listing with search query."""
         mock_response = {'messages': [{'id': 'msg1', 'threadId': 'thread1'}]}
@@ -162,6 +212,32 @@ class TestGmailClient(unittest.TestCase):
             userId='me', id='test123', format='full'
         )
 
+    def test_get_raw_messages_batches_in_chunks_of_50(self):
+        """Test that batched fetches send at most 50 requests per batch."""
+        msg_ids = [f"msg{i}" for i in range(120)]
+        batches = self.use_batch({msg_id: self.create_mock_message(msg_id) for msg_id in msg_ids})
+        
+        results = self.client.get_raw_messages(msg_ids)
+        
+        self.assertEqual([len(batch.request_ids) for batch in batches], [50, 50, 20])
+        self.assertEqual(list(results), msg_ids)
+        self.assertEqual(results['msg7']['id'], 'msg7')
+
+    def test_get_raw_messages_omits_failed_items(self):
+        """Test that a failed item in a batch is logged and left out of the result."""
+        error = HttpError(Mock(status=404), b'Not Found')
+        self.use_batch({
+            'msg1': self.create_mock_message('msg1'),
+            'gone': error,
+            'msg2': self.create_mock_message('msg2'),
+        })
+        
+        results = self.client.get_raw_messages(['msg1', 'gone', 'msg2'])
+        
+        self.assertEqual(list(results), ['msg1', 'msg2'])
+        self.client.logger.error.assert_called_once()
+        self.assertIn('gone', self.client.logger.error.call_args[0][0])
+
     def test_get_formatted_message(self):
         """Test message formatting functionality."""
         mock_message = self.create_mock_message()
@@ -511,7 +587,7 @@ class TestGmailClient(unittest.TestCase):
         # Mock individual message responses
         mock_msg1 = self.create_mock_message("msg1", "sender1@example.com", "Subject 1")
         mock_msg2 = self.create_mock_message("msg2", "sender2@example.com", "Subject 2")
-        self.mock_service.users().messages().get().execute.side_effect = [mock_msg1, mock_msg2]
+        self.use_batch({'msg1': mock_msg1, 'msg2': mock_msg2})
         
         results = self.client.search_messages("from:sender1@example.com")
         
@@ -529,7 +605,7 @@ class TestGmailClient(unittest.TestCase):
         
         # Mock message response
         mock_message = self.create_mock_message("unread1")
-        self.mock_service.users().messages().get().execute.return_value = mock_message
+        self.use_batch({'unread1': mock_message})
         
         results = self.client.fetch_unread(hours=24, category="PRIMARY")
         
@@ -0,0 +1,76 @@
+import unittest
+import tempfile
+import sys, os
+from pathlib import Path
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import utils
+from app.utils import update_keys, update_keys_bulk, read_env_values
+
+class TestUpdateKeys(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.env_path = Path(self.tmp_dir.name) / ".env"
+        patcher = patch.object(utils, "_ENV_PATH", self.env_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def read_env(self):
+        return self.env_path.read_text(encoding="utf-8")
+
+    def test_creates_missing_file(self):
+        update_keys("WEATHER_API_KEY", "abc")
+        self.assertEqual(self.read_env(), "WEATHER_API_KEY=abc\n")
+
+    def test_replaces_existing_key_and_keeps_other_lines(self):
+        self.env_path.write_text("# comment\nLANG=en\nWEATHER_API_KEY=old\n", encoding="utf-8")
+        update_keys("WEATHER_API_KEY", "new")
+        self.assertEqual(self.read_env(), "# comment\nLANG=en\nWEATHER_API_KEY=new\n")
+
+    def test_appends_after_line_without_newline(self):
+        self.env_path.write_text("LANG=en", encoding="utf-8")
+        update_keys("TIMEOUT", "5")
+        self.assertEqual(self.read_env(), "LANG=en\nTIMEOUT=5\n")
+
+    def test_key_prefix_does_not_match_longer_key(self):
+        self.env_path.write_text("LANG_CODE=x\n", encoding="utf-8")
+        update_keys("LANG", "fr")
+        self.assertEqual(self.read_env(), "LANG_CODE=x\nLANG=fr\n")
+
+    def test_unchanged_value_skips_write(self):
+        self.env_path.write_text("A=1\nB=2", encoding="utf-8")
+        mtime = self.env_path.stat().st_mtime_ns
+        self.assertFalse(update_keys_bulk({"A": "1", "B": "2"}))
+        self.assertEqual(self.read_env(), "A=1\nB=2")
+        self.assertEqual(self.env_path.stat().st_mtime_ns, mtime)
+        self.assertTrue(update_keys("B", "3"))
+
+    def test_bulk_update_single_pass(self):
+        self.env_path.write_text("A=1\nB=2\n", encoding="utf-8")
+        update_keys_bulk({"B": "3", "C": "4"})
+        self.assertEqual(self.read_env(), "A=1\nB=3\nC=4\n")
+        self.assertEqual(os.listdir(self.tmp_dir.name), [".env"])
+
+    def test_external_edit_between_updates_is_kept(self):
+        self.env_path.write_text("A=1\n", encoding="utf-8")
+        update_keys("B", "2")
+        self.env_path.write_text("A=1\nB=2\nEXTRA=yes\n", encoding="utf-8")
+        update_keys("A", "9")
+        self.assertEqual(self.read_env(), "A=9\nB=2\nEXTRA=yes\n")
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_update_keeps_file_mode(self):
+        self.env_path.write_text("A=1\n", encoding="utf-8")
+        os.chmod(self.env_path, 0o644)
+        update_keys("A", "2")
+        self.assertEqual(self.env_path.stat().st_mode & 0o777, 0o644)
+        self.assertEqual(os.listdir(self.tmp_dir.name), [".env"])
+
+    def test_read_env_values_after_update(self):
+        self.env_path.write_text('# comment\nLANG="en"\n', encoding="utf-8")
+        update_keys("TIMEOUT", "5")
+        self.assertEqual(read_env_values(), {"LANG": "en", "TIMEOUT": "5"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import unittest
+import asyncio
+import sys, os
+from types import SimpleNamespace
+from unittest.mock import patch
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import aiohttp
+from app.services import weather_service
+from app.services.weather_service import WeatherService
+from app.modules.weather import WeatherMode
+
+
+class StubFetcher:
+    """Stands in for FetchWeather; replays scripted outcomes and counts upstream calls."""
+
+    def __init__(self, outcomes=None, delay=0.0):
+        self.lang = "en"
+        self.temp_unit = "C"
+        self.outcomes = list(outcomes or [])
+        self.delay = delay
+        self.calls = 0
+
+    async def fetch_weather(self, session, target, mode, format, **others):
+        self.calls += 1
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        outcome = self.outcomes.pop(0) if self.outcomes else {"location": target, "call": self.calls}
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class TestWeatherService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.fetcher = StubFetcher()
+        patcher = patch.object(weather_service, "get_fetcher", return_value=self.fetcher)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.service = WeatherService(
+            SimpleNamespace(timeout=5.0, location=None),
+            SimpleNamespace(session=None),
+        )
+
+    async def test_concurrent_identical_requests_share_one_fetch(self):
+        self.fetcher.delay = 0.01
+        results = await asyncio.gather(*(self.service.get_weather("Paris") for _ in range(5)))
+        self.assertEqual(self.fetcher.calls, 1)
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(self.service._inflight, {})
+
+    async def test_different_queries_are_not_coalesced(self):
+        self.fetcher.delay = 0.01
+        await asyncio.gather(
+            self.service.get_weather("Paris"),
+            self.service.get_weather("Rome"),
+            self.service.get_weather("Paris", WeatherMode.FORECAST, days=3),
+        )
+        self.assertEqual(self.fetcher.calls, 3)
+
+    async def test_cached_result_expires_after_mode_ttl(self):
+        ttl = WeatherService._CACHE_TTL[WeatherMode.CURRENT]
+        with patch.object(WeatherService, "_clock", return_value=1000.0):
+            first = await self.service.get_weather("Paris")
+        with patch.object(WeatherService, "_clock", return_value=1000.0 + ttl - 1):
+            self.assertIs(await self.service.get_weather("Paris"), first)
+        self.assertEqual(self.fetcher.calls, 1)
+        with patch.object(WeatherService, "_clock", return_value=1000.0 + ttl + 1):
+            refreshed = await self.service.get_weather("Paris")
+        self.assertEqual(self.fetcher.calls, 2)
+        self.assertIsNot(refreshed, first)
+
+    async def test_lang_or_unit_change_misses_the_cache(self):
+        first = await self.service.get_weather("Paris")
+        self.fetcher.temp_unit = "F"
+        self.assertIsNot(await self.service.get_weather("Paris"), first)
+        self.fetcher.lang = "fr"
+        await self.service.get_weather("Paris")
+        self.assertEqual(self.fetcher.calls, 3)
+
+    async def test_error_results_are_not_cached(self):
+        self.fetcher.outcomes = [{"error": "No matching location found."}]
+        self.assertIn("error", await self.service.get_weather("Nowhere"))
+        self.assertNotIn("error", await self.service.get_weather("Nowhere"))
+        self.assertEqual(self.fetcher.calls, 2)
+
+    async def test_full_cache_drops_expired_then_oldest_entries(self):
+        with patch.object(WeatherService, "_CACHE_MAX_ENTRIES", 2):
+            with patch.object(WeatherService, "_clock", return_value=0.0):
+                await self.service.get_weather("A")
+                await self.service.get_weather("B", WeatherMode.HISTORY, dt="2024-01-01")
+            # "A" (60s TTL) has expired by now, "B" (history, 3600s) has not
+            with patch.object(WeatherService, "_clock", return_value=120.0):
+                await self.service.get_weather("C", WeatherMode.HISTORY, dt="2024-01-01")
+                self.assertEqual([key[0] for key in self.service._cache], ["B", "C"])
+                await self.service.get_weather("D", WeatherMode.HISTORY, dt="2024-01-01")
+                self.assertEqual([key[0] for key in self.service._cache], ["C", "D"])
+
+    async def test_transient_failures_are_retried_with_backoff(self):
+        self.fetcher.outcomes = [
+            asyncio.TimeoutError(),
+            aiohttp.ClientConnectionError("connection reset"),
+            {"location": "Paris"},
+        ]
+        with patch.object(weather_service.asyncio, "sleep") as sleep:
+            result = await self.service.get_weather("Paris")
+        self.assertEqual(result, {"location": "Paris"})
+        self.assertEqual(self.fetcher.calls, 3)
+        backoff = WeatherService._RETRY_BACKOFF
+        self.assertEqual([call.args[0] for call in sleep.await_args_list], [backoff, backoff * 2])
+
+    async def test_gives_up_after_three_attempts(self):
+        self.fetcher.outcomes = [asyncio.TimeoutError()] * 3 + [{"location": "Paris"}]
+        with patch.object(weather_service.asyncio, "sleep") as sleep:
+            result = await self.service.get_weather("Paris")
+        self.assertEqual(result, {"error": "Request timed out"})
+        self.assertEqual(self.fetcher.calls, WeatherService._RETRY_ATTEMPTS)
+        self.assertEqual(sleep.await_count, WeatherService._RETRY_ATTEMPTS - 1)
+        self.assertEqual(self.service._cache, {})
+
+    async def test_other_errors_are_not_retried(self):
+        self.fetcher.outcomes = [ValueError("bad payload")]
+        result = await self.service.get_weather("Paris")
+        self.assertEqual(result, {"error": "Weather service error: bad payload"})
+        self.assertEqual(self.fetcher.calls, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()